@@ -0,0 +1,63 @@
+# benchmarks/attack_pool.py
+"""Allocation churn of rapid-fire attacks with and without the attack pool.
+
+Run from the repository root:  python benchmarks/attack_pool.py
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from valentine_game.controls import Action, ScriptedControls
+from valentine_game.main import Game
+
+FRAMES = 6000
+# An open arena, so attacks only ever end by finishing their animation. The one
+# enemy patrols a row the attacks never reach, so the game doesn't end.
+ARENA = ['B' * 20, 'B' + 'E' + '.' * 17 + 'B'] + ['B' + '.' * 18 + 'B'] * 5 + ['B' + '.' * 8 + 'P' + '.' * 9 + 'B'] + ['B' + '.' * 18 + 'B'] * 6 + ['B' * 20]
+
+
+def run(game, pool_size):
+    """Fire an attack every frame; returns per-second counters."""
+    game.attack_pool.size = pool_size
+    game.attack_pool.free.clear()
+    game.attack_pool.created = game.attack_pool.reused = 0
+    # Face right once, then stand still and attack every step
+    game.controls = ScriptedControls([Action('right')] + [Action(None, 1)] * FRAMES)
+    game.new()
+
+    gc.collect()
+    collections = gc.get_stats()[0]['collections']
+    tracemalloc.start()
+    start = time.perf_counter()
+    game.simulate(FRAMES)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = game.attack_pool.stats()
+    return {
+        'attacks/s': (stats['created'] + stats['reused']) / elapsed,
+        'allocated attacks/s': stats['created'] / elapsed,
+        'gen0 GCs/s': (gc.get_stats()[0]['collections'] - collections) / elapsed,
+        'peak KiB': peak / 1024,
+        'reused %': 100 * stats['reused'] / max(1, stats['created'] + stats['reused']),
+    }
+
+
+def main():
+    game = Game(headless=True, seed=0, level=ARENA)
+    results = {'no pool': run(game, 0), 'pool': run(game, 16)}
+
+    columns = list(results['pool'])
+    print(f"{'':>8} " + " ".join(f"{column:>20}" for column in columns))
+    for name, result in results.items():
+        print(f"{name:>8} " + " ".join(f"{result[column]:>20.1f}" for column in columns))
+
+
+if __name__ == '__main__':
+    main()
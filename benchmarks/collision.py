@@ -0,0 +1,70 @@
+# benchmarks/collision.py
+"""Per-frame collision cost of the spatial grid vs. a linear scan, by map size.
+
+Run from the repository root:  python benchmarks/collision.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from valentine_game.config import TILE_SIZE, tile_map
+from valentine_game.spatial import SpatialHash
+
+MAP_SIZES = [(20, 15), (100, 100), (300, 300), (1000, 1000)]
+FRAMES = 200
+
+
+def generate_map(width, height):
+    """Tile the interior of config.tile_map to the requested size, walled in."""
+    pattern = [row[1:-1] for row in tile_map[1:-1]]
+    rows = ['B' * width]
+    for y in range(1, height - 1):
+        source = pattern[y % len(pattern)]
+        interior = (source * (width // len(source) + 1))[:width - 2]
+        rows.append('B' + interior + 'B')
+    rows.append('B' * width)
+    return rows
+
+
+def build_blocks(rows):
+    blocks = pygame.sprite.Group()
+    grid = SpatialHash()
+    for i, row in enumerate(rows):
+        for j, col in enumerate(row):
+            if col == 'B':
+                block = pygame.sprite.Sprite(blocks)
+                block.rect = pygame.Rect(j * TILE_SIZE, i * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                grid.insert(block)
+    return blocks, grid
+
+
+def time_frames(collide, probe, frames):
+    """Average seconds per frame for two collide_blocks-style queries."""
+    start = time.perf_counter()
+    for frame in range(frames):
+        probe.rect.topleft = (TILE_SIZE + frame % TILE_SIZE, TILE_SIZE + frame % TILE_SIZE)
+        collide(probe)
+        collide(probe)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    probe = pygame.sprite.Sprite()
+    probe.rect = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)
+
+    print(f"{'map':>11} {'blocks':>8} {'grid us/frame':>14} {'linear us/frame':>16}")
+    for width, height in MAP_SIZES:
+        blocks, grid = build_blocks(generate_map(width, height))
+        grid_cost = time_frames(grid.collide, probe, FRAMES)
+        # The linear scan gets very slow on big maps; a few frames are enough
+        linear_frames = max(1, FRAMES * 300 // max(len(blocks), 300))
+        linear_cost = time_frames(lambda s: pygame.sprite.spritecollide(s, blocks, False), probe, linear_frames)
+        print(f"{width:>5}x{height:<5} {len(blocks):>8} {grid_cost * 1e6:>14.1f} {linear_cost * 1e6:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/flowfield.py
+"""Flow field recompute cost by map size, and per-enemy lookup cost.
+
+A full-map field is searched over every tile; the capped one only over the
+CHASE_RADIUS square around the player, so its cost stops growing with the map.
+
+Run from the repository root:  python benchmarks/flowfield.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collision import generate_map
+from valentine_game.config import TILE_SIZE, CHASE_RADIUS
+from valentine_game.flowfield import FlowField
+from valentine_game.tilemap import TileMap
+
+MAP_SIZES = [(20, 15), (100, 100), (300, 300), (1000, 1000)]
+RECOMPUTES = 20
+LOOKUPS = 100000
+
+
+def recompute_cost(field, width, height, recomputes):
+    """Average seconds per recompute as the player walks along the middle row."""
+    start = time.perf_counter()
+    for i in range(recomputes):
+        field.update(((1 + i % (width - 2)) * TILE_SIZE, height // 2 * TILE_SIZE))
+    return (time.perf_counter() - start) / recomputes
+
+
+def lookup_cost(field, width, height):
+    tiles = [(1 + i % (width - 2), 1 + i % (height - 2)) for i in range(1000)]
+    start = time.perf_counter()
+    for _ in range(LOOKUPS // len(tiles)):
+        for x, y in tiles:
+            field.step(x, y)
+    return (time.perf_counter() - start) / LOOKUPS
+
+
+def main():
+    print(f"{'map':>11} {'full ms/recompute':>18} {f'radius {CHASE_RADIUS} ms/recompute':>24} {'ns/lookup':>10}")
+    for width, height in MAP_SIZES:
+        tiles = TileMap.from_rows(generate_map(width, height)).tiles
+        full = FlowField(tiles, max(width, height))
+        # Full-map searches get slow on big maps; a couple are enough
+        full_cost = recompute_cost(full, width, height, min(RECOMPUTES, max(2, RECOMPUTES * 10000 // (width * height))))
+        capped_cost = recompute_cost(FlowField(tiles, CHASE_RADIUS), width, height, RECOMPUTES)
+        print(f"{width:>5}x{height:<5} {full_cost * 1e3:>18.2f} {capped_cost * 1e3:>24.2f} "
+              f"{lookup_cost(full, width, height) * 1e9:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
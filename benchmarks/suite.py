@@ -0,0 +1,236 @@
+# benchmarks/suite.py
+"""Headless benchmarks of the sprite, collision and render hot paths.
+
+Every case runs over a few entity counts or map sizes and reports the best
+microseconds per operation over several repeats. Results can be saved as a
+JSON baseline and later runs compared against it; the compare mode exits with
+status 1 if any case got slower than the threshold allows.
+
+Run from the repository root:
+
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 0.15
+    python benchmarks/suite.py --only draw --only enemy_update
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+from collision import generate_map
+from valentine_game.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from valentine_game.controls import Action
+from valentine_game.main import Game
+
+REPEATS = 5
+DIRECTIONS = [Action(direction) for direction in ('right', 'down', 'left', 'up')]
+
+
+def arena(width, height, enemies=0, player=None):
+    """A walled, empty map with `enemies` placed row by row in its top half."""
+    rows = [['.'] * width for _ in range(height)]
+    for row in (rows[0], rows[-1]):
+        row[:] = 'B' * width
+    for row in rows:
+        row[0] = row[-1] = 'B'
+    cells = [(x, y) for y in range(1, height // 2, 2) for x in range(1, width - 1, 2)]
+    if enemies > len(cells):
+        raise ValueError(f"a {width}x{height} arena only has room for {len(cells)} enemies")
+    for x, y in cells[:enemies]:
+        rows[y][x] = 'E'
+    px, py = player or (width // 2, height * 3 // 4)
+    rows[py][px] = 'P'
+    return [''.join(row) for row in rows]
+
+
+def arena_for(enemies):
+    """Smallest roughly 4:3 arena with room for `enemies` in its top half."""
+    width = 20
+    while (width // 2 - 1) * ((width * 3 // 4) // 4) < enemies:
+        width += 10
+    return arena(width, width * 3 // 4, enemies)
+
+
+def start(game, level):
+    game.tile_map = level
+    game.new()
+    return game
+
+
+def best(run, number, repeats=REPEATS):
+    """Best microseconds per call of run() over `repeats` batches of `number` calls."""
+    times = []
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - begin) / number)
+    return min(times) * 1e6
+
+
+# Cases: each takes the shared headless Game and one parameter, and returns
+# microseconds per operation (or None when it can't run here)
+
+def get_sprite(game, count):
+    """Slicing `count` frames straight off a spritesheet (what the atlas avoids)."""
+    sheet = game.character
+    frames = [(32 * (i % 4), 40 * (i % 3), 32, 32) for i in range(count)]
+
+    def run():
+        for frame in frames:
+            sheet.get_sprite(*frame)
+    return best(run, 20)
+
+
+def player_update(game, size):
+    """One Player.update, including collide_blocks on both axes, on a wall-heavy map."""
+    start(game, generate_map(*size))
+    player = game.player
+    step = [0]
+
+    def run():
+        step[0] += 1
+        game.action = DIRECTIONS[step[0] // 30 % 4]
+        player.update()
+    return best(run, 2000)
+
+
+def enemy_update(game, count):
+    """A frame's worth of Enemy.update calls for `count` patrolling enemies."""
+    start(game, arena_for(count))
+    enemies = game.enemies.sprites()
+
+    def run():
+        for enemy in enemies:
+            enemy.update()
+    return best(run, 50)
+
+
+def attack(game, count):
+    """One attack from spawn to the end of its animation, with `count` enemies about."""
+    start(game, arena_for(count))
+    x, y = game.player.rect.topleft
+
+    def run():
+        spawned = game.attack_pool.acquire(x, y, 'up')
+        while spawned.alive():
+            spawned.update()
+    return best(run, 200)
+
+
+def create_tile_map(game, size):
+    """Game.new(), which builds every block and enemy of a text map this size."""
+    level = generate_map(*size)
+    return best(lambda: start(game, level), 1, repeats=3)
+
+
+def draw(game, size):
+    """One Game.draw() of a map this size (viewport drawing once it's bigger than the screen)."""
+    start(game, generate_map(*size))
+    game.draw()  # Bake the tile layer outside the timing
+    return best(game.draw, 300)
+
+
+def video_frame(game, size):
+    """Convert one decoded video frame of this resolution into a screen-sized Surface."""
+    from valentine_game.video import VideoPlayer, opencv
+    try:
+        opencv()
+    except ImportError:
+        return None  # OpenCV isn't installed
+    player = VideoPlayer(None, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    frame = np.random.default_rng(0).integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+
+    def run():
+        pygame.image.frombuffer(player.convert(frame), player.size, 'RGB')
+    return best(run, 50)
+
+
+CASES = {
+    'get_sprite': (get_sprite, [10, 100, 1000]),
+    'player_update': (player_update, [(20, 15), (100, 100), (300, 300)]),
+    'enemy_update': (enemy_update, [10, 100, 1000]),
+    'attack': (attack, [0, 100, 1000]),
+    'create_tile_map': (create_tile_map, [(20, 15), (100, 100), (300, 300)]),
+    'draw': (draw, [(20, 15), (100, 100), (300, 300)]),
+    'video_frame': (video_frame, [(640, 360), (1280, 720), (1920, 1080)]),
+}
+
+
+def label(param):
+    return 'x'.join(map(str, param)) if isinstance(param, tuple) else str(param)
+
+
+def run_cases(names):
+    game = Game(headless=True, seed=0)
+    game.new()  # Loads the spritesheets
+    results = {}
+    for name in names:
+        case, params = CASES[name]
+        for param in params:
+            key = f"{name}[{label(param)}]"
+            game.random.seed(0)
+            us = case(game, param)
+            if us is not None:
+                results[key] = us
+            print(f"{key:<28} {'skipped' if us is None else f'{us:>12.1f} us'}", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print old vs. new per case; returns the keys that slowed down by more than threshold."""
+    regressions = []
+    print(f"{'case':<28} {'baseline us':>12} {'now us':>12} {'change':>8}")
+    for key, us in results.items():
+        old = baseline.get(key)
+        if old is None:
+            print(f"{key:<28} {'-':>12} {us:>12.1f} {'new':>8}")
+            continue
+        change = us / old - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(key)
+            flag = '  SLOWER'
+        print(f"{key:<28} {old:>12.1f} {us:>12.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument('--only', action='append', choices=list(CASES), help="run just this case (repeatable)")
+    parser.add_argument('--save', metavar='JSON', help="write the results here as a baseline")
+    parser.add_argument('--compare', metavar='JSON', help="compare against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=0.15, help="allowed slowdown before a case is flagged (0.15 = 15%%)")
+    args = parser.parse_args()
+
+    results = run_cases(args.only or list(CASES))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'machine': platform.machine(),
+                'results': results,
+            }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+    elif not args.save:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
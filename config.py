@@ -1,35 +0,0 @@
-# config.py
-
-SCREEN_WIDTH = 640
-SCREEN_HEIGHT = 480
-TILE_SIZE = 32
-
-PLAYER_LAYER = 3
-BLOCK_LAYER = 1
-ENEMY_LAYER = 2
-
-PLAYER_SPEED = 3
-ENEMY_SPEED = 2
-
-FPS = 60
-
-BLACK = (0, 0, 0)
-
-
-tile_map = [
-    'BBBBBBBBBBBBBBBBBBBB',
-    'B.......E.....E....B',
-    'B....BBBB..BBBB....B',
-    'B.E.B....BB....B...B',
-    'B....B........B....B',
-    'B.....B......B.....B',
-    'B...E...B..B...E...B',
-    'B........BB........B',
-    'B.B.B.BBB.B.B.BBB..B',
-    'B..B..B.B..B..B.B..B',
-    'B.B.B.BBB.B.B.BBB..B',
-    'B..............E...B',
-    'B...E..............B',
-    'B........P.........B',
-    'BBBBBBBBBBBBBBBBBBBB',
-]
@@ -1,17 +1,42 @@
 from setuptools import setup
+from setuptools.command.build_py import build_py
 import os
+import sys
 
-APP = ['valentine-game.py']
-DATA_FILES = ['block.png', 'intro_background.png', 'roses.mp4', 'MoveOnlyRegular.ttf']
-OPTIONS = {
-    'argv_emulation': True,
-    'packages': ['pygame', 'cv2', 'numpy'],
-    'iconfile': 'icon.icns',  # Optional: Add a custom icon
-}
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class BuildWithAssetBundle(build_py):
+    """Pack the images into assets/bundle.bin before the usual build, so it ships with them."""
+
+    def run(self):
+        sys.path.insert(0, ROOT)
+        from valentine_game import bundle
+        bundle.build(os.path.join(ROOT, 'valentine_game', 'assets'))
+        super().run()
+
+
+extra = {}
+if 'py2app' in sys.argv:
+    # macOS application: `python -m valentine_game.bundle && python setup.py py2app`
+    extra = dict(
+        app=['valentine_game/__main__.py'],
+        options={'py2app': {
+            'argv_emulation': True,
+            'packages': ['pygame', 'numpy', 'valentine_game'],
+        }},
+        setup_requires=['py2app'],
+    )
 
 setup(
-    app=APP,
-    data_files=DATA_FILES,
-    options={'py2app': OPTIONS},
-    setup_requires=['py2app'],
+    name='valentine-game',
+    version='1.0',
+    packages=['valentine_game'],
+    # Found next to the package by resources.get_asset_path(), wherever it is installed
+    package_data={'valentine_game': ['assets/*.png', 'assets/*.ttf', 'assets/*.mp3', 'assets/*.mp4', 'assets/bundle.bin']},
+    install_requires=['pygame', 'numpy'],
+    extras_require={'video': ['opencv-python']},  # Only for the game-over video
+    entry_points={'gui_scripts': ['valentine-game = valentine_game.main:run']},
+    cmdclass={'build_py': BuildWithAssetBundle},
+    **extra,
 )
@@ -0,0 +1,57 @@
+# tests/test_bundle.py
+import os
+import shutil
+import subprocess
+import sys
+import pygame
+import valentine_game
+from valentine_game import bundle
+
+LOAD = """
+import pygame
+from valentine_game.resources import resources, get_asset_path
+pygame.display.set_mode((1, 1))
+for name in ('block.png', 'attack.png', 'Elmo_spritesheet.png'):
+    resources.image(get_asset_path(name))
+print(resources.bundle_loads, resources.disk_loads)
+"""
+
+
+def copy_package(target, shift=0):
+    """Copy the package with its assets' file times moved by shift seconds."""
+    source = os.path.dirname(valentine_game.__file__)
+    package = os.path.join(target, 'valentine_game')
+    shutil.copytree(source, package, ignore=shutil.ignore_patterns('__pycache__', bundle.FILENAME))
+    for name in os.listdir(os.path.join(package, 'assets')):
+        path = os.path.join(package, 'assets', name)
+        mtime = os.path.getmtime(path) + shift
+        os.utime(path, (mtime, mtime))
+    return package
+
+
+def test_installed_package_uses_bundle(tmp_path):
+    """Installers like pip don't keep file times; the bundle must still match its images."""
+    pygame.init()
+    built = bundle.build(os.path.join(copy_package(tmp_path / 'checkout'), 'assets'))
+    package = copy_package(tmp_path / 'site', shift=30)
+    shutil.copyfile(built, os.path.join(package, 'assets', bundle.FILENAME))
+
+    env = dict(os.environ, PYTHONPATH=str(tmp_path / 'site'))
+    output = subprocess.run([sys.executable, '-c', LOAD], env=env, cwd=tmp_path,
+                            capture_output=True, text=True, check=True).stdout
+    bundle_loads, disk_loads = map(int, output.split())
+    assert bundle_loads == 3 and disk_loads == 0
+
+
+def test_changed_image_skips_bundle(tmp_path):
+    pygame.init()
+    assets = tmp_path / 'assets'
+    assets.mkdir()
+    image = pygame.Surface((4, 4))
+    pygame.image.save(image, str(assets / 'a.png'))
+    bundled = bundle.Bundle.open(bundle.build(str(assets)))
+    assert bundled.surface(str(assets / 'a.png')) is not None
+
+    image.fill((255, 0, 0))
+    pygame.image.save(image, str(assets / 'a.png'))
+    assert bundle.Bundle.open(str(assets / bundle.FILENAME)).surface(str(assets / 'a.png')) is None
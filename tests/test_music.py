@@ -0,0 +1,18 @@
+# tests/test_music.py
+from concurrent.futures import Future
+import pygame
+from valentine_game.music import AudioManager
+
+
+def test_failed_load_is_reported(capsys):
+    future = Future()
+    future.set_exception(pygame.error("No such file or directory: 'song.mp3'."))
+    AudioManager.report(future)
+    assert "song.mp3" in capsys.readouterr().err
+
+
+def test_successful_load_is_quiet(capsys):
+    future = Future()
+    future.set_result(None)
+    AudioManager.report(future)
+    assert capsys.readouterr().err == ''
@@ -0,0 +1,69 @@
+# tests/test_snapshot.py
+import json
+import pytest
+from valentine_game import main, snapshot
+from valentine_game.controls import RandomControls, ScriptedControls
+
+
+def comparable(state):
+    """A state with enemies in spawn order, and tuples and lists alike."""
+    state = dict(state, enemies=sorted(state['enemies'], key=lambda enemy: tuple(enemy['spawn'])))
+    return json.loads(json.dumps(state))
+
+
+def play(controls, seed=0):
+    game = main.Game(headless=True, seed=seed, controls=controls)
+    game.new()
+    return game
+
+
+@pytest.fixture(params=[False, True], ids=['sprites', 'swarm'])
+def vectorized(request, monkeypatch):
+    monkeypatch.setattr(main, 'VECTORIZED_ENEMIES', request.param)
+    return request.param
+
+
+def test_restore_start_state(vectorized):
+    game = play(ScriptedControls([]))
+    assert bool(game.swarm) == vectorized
+    game.simulate(40)
+    list(game.enemy_roster.values())[-1].kill()
+    game.simulate(80)
+    snapshot.restore(game, game.start_state)
+    assert comparable(snapshot.capture(game)) == comparable(game.start_state)
+
+
+def test_checkpoint_resumes_the_same_game(vectorized, tmp_path):
+    game = play(RandomControls(seed=1), seed=1)  # Kills two enemies between frames 150 and 550
+    game.simulate(150)
+    snapshot.save(snapshot.capture(game), tmp_path / 'checkpoint.json')
+    game.simulate(550)
+    finished = comparable(snapshot.capture(game))
+
+    snapshot.restore(game, snapshot.load(tmp_path / 'checkpoint.json'))
+    game.simulate(550)
+    assert comparable(snapshot.capture(game)) == finished
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_swarm_matches_sprites(seed, monkeypatch):
+    states = []
+    for vectorized in (False, True):
+        monkeypatch.setattr(main, 'VECTORIZED_ENEMIES', vectorized)
+        game = play(RandomControls(seed=seed), seed=seed)
+        game.simulate(300)
+        states.append(comparable(snapshot.capture(game)))
+    assert states[0] == states[1]
+
+
+def test_restart_rolls_new_enemy_patrols(vectorized):
+    game = play(ScriptedControls([]), seed=None)
+    patrols = lambda: [(enemy.facing, enemy.max_travel) for enemy in game.enemy_roster.values()]
+    first = patrols()
+    restarts = []
+    for _ in range(3):
+        game.simulate(game.frame + 20)
+        game.restart()
+        restarts.append(patrols())
+    assert any(patrol != first for patrol in restarts)
+    assert comparable(snapshot.capture(game))['player'] == comparable(game.start_state)['player']
@@ -0,0 +1,34 @@
+# tests/test_sprites.py
+from valentine_game import main
+from valentine_game.controls import ScriptedControls
+
+
+def open_map(enemy_x, player_x, width=80):
+    """A walled, empty one-room map with an enemy and the player on its middle row."""
+    row = ['.'] * (width - 2)
+    row[enemy_x - 1], row[player_x - 1] = 'E', 'P'
+    empty = 'B' + '.' * (width - 2) + 'B'
+    return ['B' * width] + [empty] * 3 + ['B' + ''.join(row) + 'B'] + [empty] * 3 + ['B' * width]
+
+
+def test_unreachable_enemy_keeps_patrolling(monkeypatch):
+    monkeypatch.setattr(main, 'ENEMY_CHASE', True)
+    game = main.Game(headless=True, seed=0, controls=ScriptedControls([]), level=open_map(6, 66))
+    game.new()
+    enemy, = game.enemies.sprites()
+    spawn_x = enemy.rect.x
+    reach = enemy.max_travel * game.enemy_speed
+    for _ in range(600):
+        game.step()
+        assert abs(enemy.rect.x - spawn_x) <= reach
+
+
+def test_enemy_in_reach_chases(monkeypatch):
+    monkeypatch.setattr(main, 'ENEMY_CHASE', True)
+    game = main.Game(headless=True, seed=0, controls=ScriptedControls([]), level=open_map(6, 16))
+    game.new()
+    enemy, = game.enemies.sprites()
+    start = abs(enemy.rect.x - game.player.rect.x)
+    for _ in range(60):
+        game.step()
+    assert abs(enemy.rect.x - game.player.rect.x) < start - 60
@@ -0,0 +1,6 @@
+"""Valentine's Day Game: a small pygame maze game.
+
+Play it with `python -m valentine_game` (or the `valentine-game` command once
+installed); the headless tools are valentine_game.simulation and
+valentine_game.batch.
+"""
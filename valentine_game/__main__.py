@@ -0,0 +1,4 @@
+# __main__.py
+from valentine_game.main import run
+
+run()
@@ -0,0 +1,71 @@
+# atlas.py
+
+import pygame
+from .config import BLACK
+
+
+class FrameAtlas:
+    """Process-wide cache of sliced, scaled and flipped spritesheet frames.
+
+    Frames are keyed by (sheet, rect, scale, flip), so every sprite that asks for
+    the same frame gets the same surface back instead of re-slicing the sheet.
+    """
+
+    def __init__(self):
+        self.frames = {}
+        self.animation_sets = {}
+        self.hits = 0
+        self.misses = 0
+
+    def frame(self, sheet, rect, scale=None, flip=(False, False)):
+        """Return the shared surface for one frame of a spritesheet."""
+        key = (sheet.filename, tuple(rect), scale, flip)
+        surface = self.frames.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = sheet.get_sprite(*rect)
+        if flip != (False, False):
+            surface = pygame.transform.flip(surface, *flip)
+        if scale is not None:
+            surface = pygame.transform.scale(surface, scale)
+        surface.set_colorkey(BLACK)
+        self.frames[key] = surface
+        return surface
+
+    def animations(self, sheet, spec, scale=None):
+        """Return {name: [frames]} for an animation spec.
+
+        A spec maps an animation name to a list of (x, y, width, height, flip_x, flip_y)
+        entries. Specs are module-level constants, so the built dict is cached by
+        identity and shared between every sprite using it.
+        """
+        key = (sheet.filename, id(spec), scale)
+        cached = self.animation_sets.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached[1]
+
+        animations = {
+            name: [self.frame(sheet, entry[:4], scale, (entry[4], entry[5])) for entry in frames]
+            for name, frames in spec.items()
+        }
+        # Keep a reference to the spec so its id() can't be reused while cached
+        self.animation_sets[key] = (spec, animations)
+        return animations
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached frames."""
+        return {'hits': self.hits, 'misses': self.misses, 'frames': len(self.frames)}
+
+    def clear(self):
+        """Drop every cached frame (e.g. after the display mode changes)."""
+        self.frames.clear()
+        self.animation_sets.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+atlas = FrameAtlas()
@@ -0,0 +1,110 @@
+# batch.py
+"""Run many seeded headless sessions across a process pool and report the results.
+
+    python -m valentine_game.batch --sessions 2000 --enemy-speed 3 --max-travel 5 20 --csv runs.csv --json summary.json
+"""
+
+import os
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Keep stdout to the JSON results
+
+import argparse
+import csv
+import json
+import multiprocessing
+import time
+from .config import ENEMY_SPEED, ENEMY_MAX_TRAVEL
+from .simulation import MAX_FRAMES, run_session
+from .tilemap import load_level
+
+RESULT_FIELDS = ['seed', 'won', 'frames', 'enemies_killed']
+
+# One headless Game per worker process, reused for every session it runs
+worker_game = None
+worker_max_frames = MAX_FRAMES
+
+
+def init_worker(settings):
+    global worker_game, worker_max_frames
+    from .main import Game  # Imported here so each worker sets up its own pygame
+
+    worker_game = Game(headless=True, level=load_level(settings['level']))
+    worker_game.enemy_speed = settings['enemy_speed']
+    worker_game.enemy_max_travel = settings['max_travel']
+    worker_max_frames = settings['max_frames']
+
+
+def run_seed(seed):
+    result = run_session(worker_game, seed, max_frames=worker_max_frames)
+    return [result[field] for field in RESULT_FIELDS]
+
+
+def summarize(rows):
+    sessions = len(rows)
+    if not sessions:
+        return {'sessions': 0}
+    return {
+        'sessions': sessions,
+        'win_rate': sum(row[1] for row in rows) / sessions,
+        'mean_frames': sum(row[2] for row in rows) / sessions,
+        'mean_enemies_killed': sum(row[3] for row in rows) / sessions,
+    }
+
+
+def run_batch(seeds, settings, processes=None):
+    """Shard sessions across a process pool; returns ([result rows], elapsed seconds)."""
+    processes = processes or os.cpu_count()
+    # Big chunks keep inter-process traffic negligible next to the simulation itself
+    chunksize = max(1, len(seeds) // (processes * 4))
+    start = time.perf_counter()
+    # Spawned (not forked) workers each start a clean SDL instead of inheriting the parent's state
+    pool = multiprocessing.get_context('spawn').Pool(processes, initializer=init_worker, initargs=(settings,))
+    try:
+        rows = pool.map(run_seed, seeds, chunksize)
+    finally:
+        # close/join rather than terminate: SDL turns SIGTERM into a quit event, so
+        # terminated workers would never exit
+        pool.close()
+        pool.join()
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run seeded headless sessions in parallel.")
+    parser.add_argument('--sessions', type=int, default=1000)
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--frames', type=int, default=MAX_FRAMES, help="frame limit per session")
+    parser.add_argument('--enemy-speed', type=int, default=ENEMY_SPEED)
+    parser.add_argument('--max-travel', type=int, nargs=2, default=ENEMY_MAX_TRAVEL, metavar=('MIN', 'MAX'))
+    parser.add_argument('--level', help="binary .tmap level, or a text level laid out like config.tile_map")
+    parser.add_argument('--csv', help="write one row per session to this file")
+    parser.add_argument('--json', help="write the summary and all sessions to this file")
+    args = parser.parse_args()
+
+    settings = {
+        'level': args.level,  # Each worker loads (or memory-maps) the level itself
+        'enemy_speed': args.enemy_speed,
+        'max_travel': tuple(args.max_travel),
+        'max_frames': args.frames,
+    }
+    seeds = list(range(args.first_seed, args.first_seed + args.sessions))
+    rows, elapsed = run_batch(seeds, settings, args.processes)
+
+    summary = summarize(rows)
+    summary['seconds'] = round(elapsed, 3)
+    summary['sessions_per_second'] = round(len(rows) / elapsed, 1) if elapsed else None
+    summary['settings'] = settings
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(RESULT_FIELDS)
+            writer.writerows(rows)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'summary': summary, 'sessions': [dict(zip(RESULT_FIELDS, row)) for row in rows]}, f)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    main()
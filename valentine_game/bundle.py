@@ -0,0 +1,126 @@
+# bundle.py
+"""Pre-decoded image bundle, so a cold start skips PNG decoding and scaling.
+
+`python -m valentine_game.bundle` (also run by `setup.py build`) decodes every
+image in assets/, plus the scaled copies the game asks for, into raw RGBA
+pixels in one file, assets/bundle.bin. At run time the file is memory-mapped
+and surfaces are made straight from its pages; ResourceManager uses it
+whenever it is present and up to date, and falls back to the image files
+otherwise. Entries are matched to their image by content hash rather than
+mtime, since installers (pip among them) don't keep file times.
+
+Layout: MAGIC, a little-endian uint32 index length, a JSON index of
+{"name|WxH": {"offset", "size", "source_sha1"}} (no WxH for unscaled images),
+then the pixel data, each entry aligned to 64 bytes.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+
+MAGIC = b'VGB2'
+LENGTH = struct.Struct('<I')
+ALIGN = 64
+FILENAME = 'bundle.bin'
+
+# Scaled copies to store besides each image's original size
+VARIANTS = {
+    'intro_background.png': [(SCREEN_WIDTH, SCREEN_HEIGHT)],
+    'block.png': [(TILE_SIZE, TILE_SIZE)],
+}
+
+
+def entry_key(name, scale=None):
+    return name if scale is None else f"{name}|{scale[0]}x{scale[1]}"
+
+
+def digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class Bundle:
+    """Read-only view of a bundle file; surface() returns None for anything it doesn't hold."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an asset bundle")
+        start = len(MAGIC) + LENGTH.size
+        length, = LENGTH.unpack_from(self.data, len(MAGIC))
+        self.index = json.loads(self.data[start:start + length])
+        self.directory = os.path.dirname(path)
+        self.current = {}  # Source path -> its hash matches the bundle's
+
+    def up_to_date(self, source, sha1):
+        current = self.current.get(source)
+        if current is None:
+            current = self.current[source] = os.path.exists(source) and digest(source) == sha1
+        return current
+
+    @classmethod
+    def open(cls, path):
+        """The bundle at path, or None if there isn't a readable one."""
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    def surface(self, source, scale=None):
+        """Unconverted RGBA Surface for an image file (optionally at a scale), backed by the map."""
+        name = os.path.basename(source)
+        entry = self.index.get(entry_key(name, scale))
+        if entry is None or not self.up_to_date(source, entry['source_sha1']):
+            return None  # Not bundled, or the image changed since the bundle was built
+        width, height = entry['size']
+        offset = entry['offset']
+        return pygame.image.frombuffer(memoryview(self.data)[offset:offset + width * height * 4], (width, height), 'RGBA')
+
+
+def build(directory, path=None):
+    """Decode every image in directory (and its VARIANTS) into a bundle file; returns its path."""
+    path = path or os.path.join(directory, FILENAME)
+    entries = []
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith('.png'):
+            continue
+        source = os.path.join(directory, name)
+        image = pygame.image.load(source)
+        sha1 = digest(source)
+        for scale in [None] + VARIANTS.get(name, []):
+            surface = image if scale is None else pygame.transform.scale(image, scale)
+            entries.append((entry_key(name, scale), surface.get_size(), sha1, pygame.image.tobytes(surface, 'RGBA')))
+
+    # The index holds offsets, and its own length moves them, so lay out until it settles
+    index_length = 0
+    while True:
+        offset = len(MAGIC) + LENGTH.size + index_length
+        index = {}
+        for key, size, sha1, pixels in entries:
+            offset = -(-offset // ALIGN) * ALIGN
+            index[key] = {'offset': offset, 'size': size, 'source_sha1': sha1}
+            offset += len(pixels)
+        encoded = json.dumps(index, separators=(',', ':')).encode()
+        if len(encoded) <= index_length:
+            break
+        index_length = len(encoded) + 64
+
+    with open(path + '.part', 'wb') as f:
+        f.write(MAGIC + LENGTH.pack(index_length) + encoded.ljust(index_length))
+        for key, size, sha1, pixels in entries:
+            f.write(b'\0' * (index[key]['offset'] - f.tell()))
+            f.write(pixels)
+    os.replace(path + '.part', path)
+    return path
+
+
+if __name__ == '__main__':
+    from .resources import get_asset_path
+    written = build(os.path.dirname(get_asset_path(FILENAME)))
+    print(f"Wrote {written} ({os.path.getsize(written) / 1024 / 1024:.1f} MiB)")
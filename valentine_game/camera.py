@@ -0,0 +1,25 @@
+# camera.py
+
+import pygame
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class Camera:
+    """Screen-sized view of the world that follows a target, clamped to the map edges."""
+
+    def __init__(self, world_width, world_height):
+        self.rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.world = pygame.Rect(0, 0, max(world_width, SCREEN_WIDTH), max(world_height, SCREEN_HEIGHT))
+
+    @property
+    def scrolls(self):
+        """False when the whole map fits on screen and the view never moves."""
+        return self.world.size != self.rect.size
+
+    def follow(self, target):
+        self.rect.center = target.center
+        self.rect.clamp_ip(self.world)
+
+    def apply(self, rect):
+        """World rect -> screen rect."""
+        return rect.move(-self.rect.x, -self.rect.y)
@@ -0,0 +1,146 @@
+# chunks.py
+
+import numpy as np
+import pygame
+from .config import TILE_SIZE, CHUNK_SIZE, CHUNK_RADIUS, BLACK
+from .sprites import Block, Enemy
+from .tilemap import WALL, ENEMY
+
+
+class Chunk:
+    def __init__(self, key, origin, size, blocks, enemies):
+        self.key = key
+        self.rect = pygame.Rect(origin[0] * TILE_SIZE, origin[1] * TILE_SIZE, size[0] * TILE_SIZE, size[1] * TILE_SIZE)
+        self.blocks = blocks
+        self.enemies = enemies
+        self.surface = None  # Baked on first draw, so headless games never pay for it
+
+    def bake(self):
+        self.surface = pygame.Surface(self.rect.size).convert()
+        self.surface.fill(BLACK)
+        for block in self.blocks:
+            self.surface.blit(block.image, block.rect.move(-self.rect.x, -self.rect.y))
+        return self.surface
+
+
+class ChunkManager:
+    """Streams a TileMap in CHUNK_SIZE squares around the player.
+
+    Blocks, enemies and their grid entries only exist for chunks within
+    CHUNK_RADIUS of the player's chunk; chunks further than one more ring away
+    are dropped. Enemies killed in a chunk stay dead when it is loaded again.
+    """
+
+    def __init__(self, game, tile_map, chunk_size=CHUNK_SIZE, radius=CHUNK_RADIUS):
+        self.game = game
+        self.tile_map = tile_map
+        self.chunk_size = chunk_size
+        self.radius = radius
+        self.loaded = {}
+        self.killed = set()
+        self.center = None
+
+    @property
+    def enemies_remaining(self):
+        return self.tile_map.enemy_count - len(self.killed)
+
+    def chunk_at(self, x, y):
+        """Chunk key for a world pixel position."""
+        span = self.chunk_size * TILE_SIZE
+        return x // span, y // span
+
+    def update(self):
+        """Load/unload chunks after the player moved; returns True if anything changed."""
+        center = self.chunk_at(*self.game.player.rect.center)
+        if center == self.center:
+            return False
+        self.center = center
+
+        for key in list(self.loaded):
+            # One ring of slack so walking along a chunk edge doesn't thrash
+            if max(abs(key[0] - center[0]), abs(key[1] - center[1])) > self.radius + 1:
+                self.unload(key)
+
+        last_x = (self.tile_map.width - 1) // self.chunk_size
+        last_y = (self.tile_map.height - 1) // self.chunk_size
+        for cy in range(max(0, center[1] - self.radius), min(last_y, center[1] + self.radius) + 1):
+            for cx in range(max(0, center[0] - self.radius), min(last_x, center[0] + self.radius) + 1):
+                if (cx, cy) not in self.loaded:
+                    self.load((cx, cy))
+        return True
+
+    def load(self, key):
+        size = self.chunk_size
+        tiles, (x0, y0) = self.tile_map.region(key[0] * size, key[1] * size, size, size)
+        game = self.game
+
+        blocks = []
+        ys, xs = np.nonzero(tiles == WALL)
+        for y, x in zip((ys + y0).tolist(), (xs + x0).tolist()):
+            block = Block(game, x, y)
+            game.block_grid.insert(block)
+            blocks.append(block)
+
+        enemies = []
+        ys, xs = np.nonzero(tiles == ENEMY)
+        for y, x in zip((ys + y0).tolist(), (xs + x0).tolist()):
+            if (x, y) not in self.killed:
+                enemies.append(Enemy(game, x, y))
+
+        self.loaded[key] = Chunk(key, (x0, y0), (tiles.shape[1], tiles.shape[0]), blocks, enemies)
+
+    def unload(self, key):
+        chunk = self.loaded.pop(key)
+        for block in chunk.blocks:
+            self.game.block_grid.remove(block)
+            block.kill()
+        for enemy in chunk.enemies:
+            self.game.enemy_roster.pop(enemy.spawn, None)
+            if enemy.alive():
+                enemy.despawn()
+
+    def draw_tiles(self, surface, offset=(0, 0)):
+        """Blit the baked tiles of every loaded chunk that overlaps the surface."""
+        view = surface.get_rect(topleft=offset)
+        for chunk in self.loaded.values():
+            if chunk.rect.colliderect(view):
+                surface.blit(chunk.surface or chunk.bake(), chunk.rect.move(-offset[0], -offset[1]))
+
+
+class TileCache:
+    """Baked CHUNK_SIZE squares of a map whose blocks all exist, made as the camera reaches them.
+
+    Text maps create every Block up front. For ones bigger than the screen this
+    keeps tile memory proportional to the view rather than the map: squares are
+    baked from a block grid query when they come into view and dropped once
+    they are more than a ring away from it.
+    """
+
+    def __init__(self, game, chunk_size=CHUNK_SIZE):
+        self.game = game
+        self.chunk_size = chunk_size
+        self.baked = {}
+
+    def draw_tiles(self, surface, offset=(0, 0)):
+        """Blit every baked square that overlaps the surface, baking missing ones."""
+        span = self.chunk_size * TILE_SIZE
+        view = surface.get_rect(topleft=offset)
+        left, top = view.left // span, view.top // span
+        right, bottom = (view.right - 1) // span, (view.bottom - 1) // span
+
+        for key in list(self.baked):
+            if not (left - 1 <= key[0] <= right + 1 and top - 1 <= key[1] <= bottom + 1):
+                del self.baked[key]
+
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                chunk = self.baked.get((cx, cy)) or self.bake((cx, cy))
+                surface.blit(chunk.surface, chunk.rect.move(-offset[0], -offset[1]))
+
+    def bake(self, key):
+        size = self.chunk_size
+        chunk = Chunk(key, (key[0] * size, key[1] * size), (size, size), [], [])
+        chunk.blocks = [block for block in self.game.block_grid.query(chunk.rect) if block.rect.colliderect(chunk.rect)]
+        chunk.bake()
+        self.baked[key] = chunk
+        return chunk
@@ -0,0 +1,69 @@
+# config.py
+
+SCREEN_WIDTH = 640
+SCREEN_HEIGHT = 480
+TILE_SIZE = 32
+
+PLAYER_LAYER = 3
+BLOCK_LAYER = 1
+ENEMY_LAYER = 2
+
+PLAYER_SPEED = 3
+ENEMY_SPEED = 2
+ENEMY_MAX_TRAVEL = (7, 30)  # Range of patrol lengths, in movement steps
+VECTORIZED_ENEMIES = False  # Batch enemy patrols with NumPy arrays instead of per-sprite updates
+ENEMY_CHASE = False  # Enemies within CHASE_RADIUS tiles follow a flow field to the player instead of patrolling
+CHASE_RADIUS = 24
+
+FPS = 60
+STEP_MS = 1000 / FPS  # Fixed logic timestep
+MAX_CATCHUP_STEPS = 5  # Logic steps allowed per rendered frame after a stall
+
+ATTACK_POOL_SIZE = 16  # Finished attacks kept around for reuse
+
+# Binary (.tmap) levels are streamed in CHUNK_SIZE x CHUNK_SIZE tile squares,
+# keeping the chunks within CHUNK_RADIUS of the player's chunk loaded
+CHUNK_SIZE = 16
+CHUNK_RADIUS = 1
+
+# Dirty-rectangle rendering: only push changed screen areas to the display
+DIRTY_RECTS = False
+
+ASSET_LOADER_THREADS = 4  # Background threads streaming assets in during the intro
+
+# Game-over video: None streams it through a ring buffer of VIDEO_BUFFER_FRAMES,
+# 'memory' decodes it once and keeps the frames, 'mmap' also caches them on disk
+VIDEO_CACHE = None
+VIDEO_BUFFER_FRAMES = 8
+
+# Audio: effect name -> file in assets/, e.g. {'attack': 'attack.wav', 'hit': 'hit.wav'}.
+# Effects are decoded up front and share AUDIO_CHANNELS mixer channels.
+SOUND_EFFECTS = {}
+AUDIO_CHANNELS = 8
+AUDIO_BUFFER = 512
+
+# Per-frame profiling: rolling percentiles, an overlay (toggle with F3) and an
+# optional JSON-lines trace file with every frame's section timings
+PROFILE = False
+PROFILE_TRACE = None
+
+BLACK = (0, 0, 0)
+
+
+tile_map = [
+    'BBBBBBBBBBBBBBBBBBBB',
+    'B.......E.....E....B',
+    'B....BBBB..BBBB....B',
+    'B.E.B....BB....B...B',
+    'B....B........B....B',
+    'B.....B......B.....B',
+    'B...E...B..B...E...B',
+    'B........BB........B',
+    'B.B.B.BBB.B.B.BBB..B',
+    'B..B..B.B..B..B.B..B',
+    'B.B.B.BBB.B.B.BBB..B',
+    'B..............E...B',
+    'B...E..............B',
+    'B........P.........B',
+    'BBBBBBBBBBBBBBBBBBBB',
+]
@@ -0,0 +1,175 @@
+# controls.py
+"""Player input as one Action per fixed logic step.
+
+Window events are read once per rendered frame into an InputBuffer with the
+time they were read; each logic step then polls its controls with whatever
+the buffer holds, as (timestamp, event) pairs. A key tapped during a slow
+frame is therefore still seen by the next step rather than dropped.
+"""
+
+import random
+from collections import deque
+import pygame
+
+DIRECTION_CODES = {'left': 'L', 'right': 'R', 'up': 'U', 'down': 'D'}
+CODE_DIRECTIONS = {code: direction for direction, code in DIRECTION_CODES.items()}
+
+
+class Action:
+    """What the player does during one logic step: a move direction and attack presses."""
+
+    __slots__ = ('direction', 'attacks', 'timestamp')
+
+    def __init__(self, direction=None, attacks=0, timestamp=None):
+        self.direction = direction
+        self.attacks = attacks
+        self.timestamp = timestamp  # perf_counter() time of the earliest input behind it, if live
+
+    def encode(self):
+        """Compact text form used by recordings, e.g. 'L', 'UA' or '.' for idle."""
+        text = DIRECTION_CODES.get(self.direction, '') + 'A' * self.attacks
+        return text or '.'
+
+    @classmethod
+    def decode(cls, text):
+        text = text.strip()
+        direction = CODE_DIRECTIONS.get(text[:1])
+        return cls(direction, text.count('A'))
+
+
+IDLE = Action()
+
+
+class InputBuffer:
+    """Window events stamped with the time they were read, held until a logic step takes them."""
+
+    def __init__(self):
+        self.events = deque()
+
+    def pump(self, events, timestamp):
+        for event in events:
+            self.events.append((timestamp, event))
+
+    def drain(self):
+        """Return and forget every buffered (timestamp, event) pair."""
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+
+class KeyboardControls:
+    """Live keyboard input, the default for a windowed game.
+
+    Held arrow keys move the player; a key pressed and released between two
+    steps still moves it for one step, and every space press is one attack.
+    """
+
+    # Checked in order, so left/right win over up/down like they always have
+    KEYS = ((pygame.K_LEFT, 'left'), (pygame.K_RIGHT, 'right'), (pygame.K_UP, 'up'), (pygame.K_DOWN, 'down'))
+    DIRECTION_KEYS = dict(KEYS)
+
+    def poll(self, events):
+        attacks = 0
+        tapped = set()
+        timestamp = None
+        for time, event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_SPACE:
+                attacks += 1
+            elif event.key in self.DIRECTION_KEYS:
+                tapped.add(event.key)
+            else:
+                continue
+            if timestamp is None:
+                timestamp = time
+
+        keys = pygame.key.get_pressed()
+        direction = next((name for key, name in self.KEYS if keys[key] or key in tapped), None)
+        return Action(direction, attacks, timestamp)
+
+
+class ScriptedControls:
+    """Replays a fixed list of actions, one per logic step, then stays idle."""
+
+    def __init__(self, actions):
+        self.actions = list(actions)
+        self.index = 0
+
+    @classmethod
+    def load(cls, path):
+        """Load a recording written by RecordingControls.save (one action per line)."""
+        with open(path) as f:
+            return cls(Action.decode(line) for line in f if line.strip())
+
+    @property
+    def finished(self):
+        return self.index >= len(self.actions)
+
+    def state(self):
+        return self.index
+
+    def restore(self, state):
+        self.index = state
+
+    def poll(self, events):
+        if self.finished:
+            return IDLE
+        action = self.actions[self.index]
+        self.index += 1
+        return action
+
+
+class RandomControls:
+    """Seeded random play: holds a direction for a while and attacks now and then."""
+
+    def __init__(self, seed=None, attack_chance=0.05, hold=(5, 40)):
+        self.random = random.Random(seed)
+        self.attack_chance = attack_chance
+        self.hold = hold
+        self.direction = None
+        self.remaining = 0
+
+    def poll(self, events):
+        if self.remaining <= 0:
+            self.direction = self.random.choice((None,) + tuple(DIRECTION_CODES))
+            self.remaining = self.random.randint(*self.hold)
+        self.remaining -= 1
+        attacks = 1 if self.random.random() < self.attack_chance else 0
+        return Action(self.direction, attacks)
+
+    def state(self):
+        return {'random': self.random.getstate(), 'direction': self.direction, 'remaining': self.remaining}
+
+    def restore(self, state):
+        version, internal, gauss = state['random']
+        self.random.setstate((version, tuple(internal), gauss))
+        self.direction = state['direction']
+        self.remaining = state['remaining']
+
+
+class RecordingControls:
+    """Wraps another controls source and records every action it produces."""
+
+    def __init__(self, source):
+        self.source = source
+        self.actions = []
+
+    def poll(self, events):
+        action = self.source.poll(events)
+        self.actions.append(action)
+        return action
+
+    def state(self):
+        state = getattr(self.source, 'state', None)
+        return state() if state else None
+
+    def restore(self, state):
+        restore = getattr(self.source, 'restore', None)
+        if restore and state is not None:
+            restore(state)
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            for action in self.actions:
+                f.write(action.encode() + '\n')
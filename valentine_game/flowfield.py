@@ -0,0 +1,105 @@
+# flowfield.py
+
+from collections import deque
+from .config import TILE_SIZE
+from .tilemap import WALL
+
+UP, DOWN, LEFT, RIGHT = (0, -1), (0, 1), (-1, 0), (1, 0)
+
+
+class FlowField:
+    """Shared shortest-path directions towards the player, on the tile grid.
+
+    One breadth-first search from the player's tile fills, for every reachable
+    floor tile within `radius`, the step that leads one tile closer to the
+    player. It is only redone when the player moves onto another tile, and an
+    enemy's lookup is a single list index, so hundreds of chasing enemies cost
+    the same search as one.
+    """
+
+    def __init__(self, tiles, radius):
+        self.tiles = tiles  # (height, width) array of tile bytes, as in TileMap
+        self.height, self.width = tiles.shape
+        self.radius = radius
+        self.origin = None
+        self.left = self.top = 0
+        self.columns = 0
+        self.distances = []
+        self.steps = []
+        self.recomputes = 0
+
+    def update(self, target):
+        """Follow the pixel position `target`; returns True if the field was recomputed."""
+        origin = (target[0] // TILE_SIZE, target[1] // TILE_SIZE)
+        if origin == self.origin:
+            return False
+        self.origin = origin
+        self.recompute()
+        return True
+
+    def recompute(self):
+        ox, oy = self.origin
+        left, top = max(0, ox - self.radius), max(0, oy - self.radius)
+        window = self.tiles[top:min(self.height, oy + self.radius + 1), left:min(self.width, ox + self.radius + 1)]
+        rows, columns = window.shape
+        self.left, self.top, self.columns = left, top, columns
+        self.recomputes += 1
+
+        count = rows * columns
+        passable = (window != WALL).ravel().tolist()
+        distances = [-1] * count
+        steps = [None] * count
+        self.distances, self.steps = distances, steps
+
+        start = (oy - top) * columns + (ox - left)
+        if not 0 <= start < count or not passable[start]:
+            return  # Player off the map or inside a wall: nothing to chase
+        distances[start] = 0
+        queue = deque([start])
+        last_row = count - columns
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            x = index % columns
+            # Each newly reached neighbour steps back towards `index`
+            if x > 0:
+                neighbour = index - 1
+                if passable[neighbour] and distances[neighbour] < 0:
+                    distances[neighbour] = distance
+                    steps[neighbour] = RIGHT
+                    queue.append(neighbour)
+            if x < columns - 1:
+                neighbour = index + 1
+                if passable[neighbour] and distances[neighbour] < 0:
+                    distances[neighbour] = distance
+                    steps[neighbour] = LEFT
+                    queue.append(neighbour)
+            if index >= columns:
+                neighbour = index - columns
+                if passable[neighbour] and distances[neighbour] < 0:
+                    distances[neighbour] = distance
+                    steps[neighbour] = DOWN
+                    queue.append(neighbour)
+            if index < last_row:
+                neighbour = index + columns
+                if passable[neighbour] and distances[neighbour] < 0:
+                    distances[neighbour] = distance
+                    steps[neighbour] = UP
+                    queue.append(neighbour)
+
+    def index(self, x, y):
+        x -= self.left
+        y -= self.top
+        if 0 <= x < self.columns and 0 <= y and y * self.columns < len(self.distances):
+            return y * self.columns + x
+        return None
+
+    def step(self, x, y):
+        """(dx, dy) one tile closer to the player from tile (x, y), or None if out of reach."""
+        index = self.index(x, y)
+        return None if index is None else self.steps[index]
+
+    def distance(self, x, y):
+        """Tiles to the player from tile (x, y), or -1 if out of reach."""
+        index = self.index(x, y)
+        return -1 if index is None else self.distances[index]
@@ -0,0 +1,431 @@
+import time
+STARTED = time.perf_counter()  # Baseline for the time-to-first-frame report
+
+import os
+import random
+import pygame
+import argparse
+import sys
+from .sprites import Spritesheet, Player, Enemy, Block, Button, AttackPool, preload_animations
+from .config import *
+from .music import AudioManager
+from .resources import get_asset_path, resources
+from .spatial import SpatialHash
+from .controls import IDLE, InputBuffer, KeyboardControls, RecordingControls, ScriptedControls
+from .swarm import EnemySwarm
+from .video import VideoPlayer
+from .tilemap import TileMap, load_level
+from .chunks import ChunkManager, TileCache
+from .camera import Camera
+from .profiler import Profiler
+from .flowfield import FlowField
+from . import snapshot
+IMPORTED = time.perf_counter()  # Import time is reported alongside time to first frame
+
+class Game:
+
+    def __init__(self, headless=False, seed=None, controls=None, level=None):
+        # Headless games get dummy SDL drivers: no window, no sound, no browser
+        self.headless = headless
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        # The mixer is opened by the audio manager on a loader thread, not here
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.clock = pygame.time.Clock()
+        self.running = True
+
+        # All game randomness goes through this RNG so a seed reproduces a run
+        self.random = random.Random(seed)
+        self.controls = controls or KeyboardControls()
+        self.input = InputBuffer()
+        self.input_shown_at = None  # Earliest input applied to the game but not yet on screen
+        self.tile_map = level or tile_map
+        self.enemy_speed = ENEMY_SPEED
+        self.enemy_max_travel = ENEMY_MAX_TRAVEL
+        self.attack_pool = AttackPool(self)
+        self.profiler = Profiler(PROFILE, trace_path=PROFILE_TRACE)
+        self.profiler.overlay = PROFILE and not headless
+
+        # Only what intro() needs is loaded up front; everything else streams in
+        # on background threads and is waited on at first use
+        font_path = get_asset_path("font.ttf")
+        self.debug(f"Font path: {font_path}")
+        self.font = resources.font(font_path, 36)
+        self.intro_background = resources.image(get_asset_path("intro_background.png"), (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.debug(f"Intro background path: {get_asset_path('intro_background.png')}")
+        self.all_enemies_dead = False
+        self.time_to_first_frame = None
+        self.overlay_font = resources.font(font_path, 14)
+
+        for filename in ("Elmo_spritesheet.png", "enemy_spritesheet.png", "attack.png"):
+            resources.load_async(get_asset_path(filename))
+        self.character = None
+
+        self.audio = AudioManager()
+        if not headless:
+            effects = {name: get_asset_path(filename) for name, filename in SOUND_EFFECTS.items()}
+            self.audio.start(get_asset_path("song.mp3"), effects)
+            self.debug(f"Music path: {get_asset_path('song.mp3')}")
+            self.video = VideoPlayer(get_asset_path("roses.mp4"), (SCREEN_WIDTH, SCREEN_HEIGHT), VIDEO_CACHE, VIDEO_BUFFER_FRAMES)
+            self.debug(f"Video path: {get_asset_path('roses.mp4')}")
+            self.video.start()
+
+    def debug(self, message):
+        """Print a debugging line; headless runs stay quiet so their stdout is just results."""
+        if not self.headless:
+            print(message)
+
+    def load_sprites(self):
+        """Build the spritesheets, waiting for any file that is still loading."""
+        self.character = Spritesheet(get_asset_path("Elmo_spritesheet.png"))
+        self.debug(f"Character spritesheet path: {get_asset_path('Elmo_spritesheet.png')}")
+        self.enemy = Spritesheet(get_asset_path("enemy_spritesheet.png"))
+        self.debug(f"Enemy spritesheet path: {get_asset_path('enemy_spritesheet.png')}")
+        self.attack_spritesheet = Spritesheet(get_asset_path("attack.png"))
+        self.debug(f"Attack spritesheet path: {get_asset_path('attack.png')}")
+
+        # Slice every animation frame once; sprites only look them up from now on
+        preload_animations(self)
+
+    def intro(self):
+        """Display the intro screen with a full-screen background."""
+        intro = True
+        background = self.intro_background
+
+        title = resources.text("Valentine's Day Game", BLACK, 36)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
+
+        play_button = Button(SCREEN_WIDTH // 2 - 100, 220, 200, 60, (255, 255, 255), (148, 3, 37), "Play", 36)
+        drawn_progress = None
+
+        while intro:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    intro = False
+                    self.running = False
+                    return
+                if event.type == pygame.MOUSEBUTTONUP:
+                    mouse_pos = pygame.mouse.get_pos()
+                    if play_button.is_pressed(mouse_pos, (1, 0, 0)):
+                        intro = False
+
+            # The intro is static, so in dirty-rect mode it is only pushed when the
+            # loading bar moves or the button changes between normal/hover/pressed
+            progress = resources.progress()
+            button_changed = play_button.update(pygame.mouse.get_pos(), pygame.mouse.get_pressed())
+            if not DIRTY_RECTS or progress != drawn_progress or button_changed:
+                self.screen.blit(background, (0, 0))
+                self.screen.blit(title, title_rect)
+                play_button.draw(self.screen)
+                if progress < 1:
+                    self.draw_loading_bar(progress)
+                pygame.display.update()
+                drawn_progress = progress
+                if self.time_to_first_frame is None:
+                    self.time_to_first_frame = time.perf_counter() - STARTED
+                    print(f"Imports: {(IMPORTED - STARTED) * 1000:.0f} ms, "
+                          f"time to first frame: {self.time_to_first_frame * 1000:.0f} ms")
+            self.clock.tick(FPS)
+
+    def draw_loading_bar(self, progress):
+        """Draw how far the background asset loading has got."""
+        outline = pygame.Rect(SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 40, 300, 12)
+        fill = outline.inflate(-4, -4)
+        fill.width = int(fill.width * progress)
+        pygame.draw.rect(self.screen, (255, 255, 255), outline, 1)
+        pygame.draw.rect(self.screen, (148, 3, 37), fill)
+
+    def createTileMap(self):
+        """Create the tile-based map from the tile_map array."""
+        self.tile_layer = None  # Baked lazily by draw()
+        if isinstance(self.tile_map, TileMap):
+            # Binary levels are streamed: only chunks near the player get sprites
+            self.player = Player(self, *self.tile_map.player)
+            self.chunks = ChunkManager(self, self.tile_map)
+            self.chunks.update()
+            return
+
+        for i, row in enumerate(self.tile_map):
+            for j, col in enumerate(row):
+                if col == 'B':
+                    self.block_grid.insert(Block(self, j, i))
+                elif col == 'P':
+                    self.player = Player(self, j, i)
+                elif col == 'E':
+                    Enemy(self, j, i)
+
+    def build_tile_layer(self):
+        """Bake every static tile of a map that fits on screen into one background surface.
+
+        Walls never move, so they are drawn once here instead of every frame.
+        Set tile_layer to None whenever the blocks change to have it rebuilt.
+        Bigger maps are drawn by draw_viewport() from per-chunk surfaces instead.
+        """
+        self.tile_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.tile_layer.fill(BLACK)
+        if self.chunks:
+            # Streamed maps: compose the layer from the chunks' baked tiles
+            self.chunks.draw_tiles(self.tile_layer)
+        else:
+            self.blocks.draw(self.tile_layer)
+        if DIRTY_RECTS:
+            self.all_sprites.clear(self.screen, self.tile_layer)
+        self.full_redraw = True
+
+    def new(self):
+        """Start a new game."""
+        if self.character is None:
+            self.load_sprites()
+        self.playing = True
+        self.all_enemies_dead = False
+        self.frame = 0
+        self.action = IDLE
+        # LayeredDirty tracks which sprites changed so draw() can return dirty rects
+        self.all_sprites = pygame.sprite.LayeredDirty() if DIRTY_RECTS else pygame.sprite.LayeredUpdates()
+        self.blocks = pygame.sprite.LayeredUpdates()
+        self.enemies = pygame.sprite.LayeredUpdates()
+        self.attacks = pygame.sprite.LayeredUpdates()
+        # Grid indexes so collision checks only look at neighbouring cells
+        self.block_grid = SpatialHash()
+        self.enemy_grid = SpatialHash()
+        self.profiler.wrap(self.block_grid, 'collide', 'collide.blocks')
+        self.profiler.wrap(self.enemy_grid, 'collide', 'collide.enemies')
+        # The swarm only batches patrols, so chasing enemies use the per-sprite path
+        self.swarm = EnemySwarm(self) if VECTORIZED_ENEMIES and not ENEMY_CHASE else None
+        self.flow_field = None
+        self.chunks = None
+        self.enemies_killed = 0
+        self.enemy_roster = {}  # Spawn tile -> Enemy, so restores can revive enemies in place
+        self.createTileMap()
+        if ENEMY_CHASE:
+            tiles = self.tile_map.tiles if self.chunks else TileMap.from_rows(self.tile_map).tiles
+            self.flow_field = FlowField(tiles, CHASE_RADIUS)
+        if self.chunks:
+            self.camera = Camera(self.tile_map.width * TILE_SIZE, self.tile_map.height * TILE_SIZE)
+        else:
+            self.camera = Camera(max(len(row) for row in self.tile_map) * TILE_SIZE, len(self.tile_map) * TILE_SIZE)
+        self.tile_cache = None if self.chunks else TileCache(self)
+        self.start_state = snapshot.capture(self)
+
+    def restart(self):
+        """Play the level again from the start, reusing every sprite instead of rebuilding the map."""
+        snapshot.restore(self, self.start_state, random=False, controls=False)
+        self.playing = True
+
+    def enemy_killed(self, enemy):
+        self.enemies_killed += 1
+        self.audio.play('hit', priority=2)
+        if self.chunks:
+            self.chunks.killed.add(enemy.spawn)
+
+    def enemies_remaining(self):
+        return self.chunks.enemies_remaining if self.chunks else len(self.enemies)
+
+    def pump(self):
+        """Read window events (once per rendered frame) into the timestamped input buffer."""
+        events = [] if self.headless else pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.playing = False
+                self.running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and self.profiler.enabled:
+                self.profiler.overlay = not self.profiler.overlay
+        self.input.pump(events, time.perf_counter())
+
+    def events(self):
+        """Read this step's action from the controls, handing them the buffered input."""
+        self.action = self.controls.poll(self.input.drain())
+        if self.action.timestamp is not None and self.input_shown_at is None:
+            self.input_shown_at = self.action.timestamp
+        for _ in range(self.action.attacks):
+            self.attack()
+
+    def attack(self):
+        """Spawn an attack on the tile the player is facing."""
+        self.audio.play('attack', priority=1)
+        if self.player.facing == 'up':
+            self.attack_pool.acquire(self.player.rect.x, self.player.rect.y - TILE_SIZE, self.player.facing)
+        elif self.player.facing == 'down':
+            self.attack_pool.acquire(self.player.rect.x, self.player.rect.y + TILE_SIZE, self.player.facing)
+        elif self.player.facing == 'left':
+            self.attack_pool.acquire(self.player.rect.x - TILE_SIZE, self.player.rect.y, self.player.facing)
+        elif self.player.facing == 'right':
+            self.attack_pool.acquire(self.player.rect.x + TILE_SIZE, self.player.rect.y, self.player.facing)
+
+    def update(self):
+        """Update all sprites."""
+        if self.flow_field:
+            with self.profiler.section('FlowField.update'):
+                self.flow_field.update(self.player.rect.center)
+        if self.swarm:
+            with self.profiler.section('EnemySwarm.update'):
+                self.swarm.update()  # Enemies update first, as they do in all_sprites' layer order
+        if self.profiler.enabled:
+            # Same as all_sprites.update(), but timed per sprite class
+            for sprite in self.all_sprites.sprites():
+                with self.profiler.section(type(sprite).__name__ + '.update'):
+                    sprite.update()
+        else:
+            self.all_sprites.update()
+        self.frame += 1
+        if self.chunks and self.chunks.update():
+            self.tile_layer = None
+        if self.enemies_remaining() == 0 and not self.all_enemies_dead:
+            self.all_enemies_dead = True
+            if self.headless:
+                self.playing = False
+                return
+            import webbrowser  # Only needed here, so not imported at startup
+            webbrowser.open("https://www.youtube.com/watch?v=mI_Ycumremk")
+            pygame.quit()
+
+    def step(self):
+        """Advance the game logic by one fixed timestep."""
+        with self.profiler.section('events'):
+            self.events()
+        with self.profiler.section('update'):
+            self.update()
+
+    def present(self, rects=None):
+        """Push the frame to the display, with the profiling overlay on top if shown."""
+        if self.profiler.overlay:
+            area = self.profiler.draw_overlay(self.screen, self.overlay_font)
+            if rects is not None:
+                rects.append(area)
+        with self.profiler.section('display.update'):
+            pygame.display.update(rects)
+        if self.input_shown_at is not None:
+            # Input-to-display latency: from reading the event to the frame that shows its effect
+            if self.profiler.enabled:
+                self.profiler.add('input.latency', time.perf_counter() - self.input_shown_at)
+            self.input_shown_at = None
+
+    def draw(self):
+        """Draw the baked tile layer, then the moving sprites."""
+        if self.camera.scrolls:
+            self.draw_viewport()
+            return
+
+        # The whole map fits on screen: no camera offset, and dirty rects can be used
+        if self.tile_layer is None:
+            self.build_tile_layer()
+        if DIRTY_RECTS and not self.full_redraw:
+            # Only the areas under changed sprites are repainted and pushed
+            self.present(self.all_sprites.draw(self.screen))
+            return
+
+        self.screen.blit(self.tile_layer, (0, 0))
+        if DIRTY_RECTS:
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+        self.all_sprites.draw(self.screen)
+        self.present()
+        self.full_redraw = False
+
+    def draw_viewport(self):
+        """Draw only what the camera sees, for maps bigger than the screen."""
+        self.camera.follow(self.player.rect)
+        view = self.camera.rect
+        # Tiles come from chunk-sized baked surfaces around the view, never a map-sized one
+        self.screen.fill(BLACK)
+        (self.chunks or self.tile_cache).draw_tiles(self.screen, view.topleft)
+
+        # Enemies come from a grid query around the view rather than a scan of every
+        # sprite; the player and attacks share the top layer and are only a handful
+        visible = [enemy for enemy in self.enemy_grid.query(view) if enemy.rect.colliderect(view)]
+        visible += [sprite for sprite in self.all_sprites.get_sprites_from_layer(PLAYER_LAYER)
+                    if sprite.rect.colliderect(view)]
+        for sprite in visible:
+            self.screen.blit(sprite.image, self.camera.apply(sprite.rect))
+        self.present()
+
+    def gameOver(self):
+        """Show the game over screen; returns True if the player chose to play again."""
+        text = resources.text("Game Over", (255, 255, 255), 36)
+        text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
+        play_again_button = Button(SCREEN_WIDTH // 2 - 130, SCREEN_HEIGHT // 2, 250, 80, (255, 255, 255), (148, 3, 37), "Play Again", 36)
+
+        self.video.start()
+        self.video.rewind()
+
+        while self.running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    return False
+                if event.type == pygame.MOUSEBUTTONDOWN:  # Detect click on button
+                    mouse_pos = pygame.mouse.get_pos()
+                    if play_again_button.is_pressed(mouse_pos, (1, 0, 0)):
+                        print("Play Again button clicked!")  # Debugging message
+                        return True  # Exit the gameOver loop; main() restarts the game
+
+            # Frames are decoded and scaled on the video thread; here we only blit
+            frame_surface = self.video.next_frame()
+            if frame_surface is not None:
+                self.screen.blit(frame_surface, (0, 0))
+            else:
+                self.screen.fill(BLACK)
+            self.screen.blit(text, text_rect)
+            play_again_button.update(pygame.mouse.get_pos(), pygame.mouse.get_pressed())
+            play_again_button.draw(self.screen)
+            pygame.display.update()
+            self.clock.tick(FPS)
+
+        self.video.release()
+        return False
+
+    def main(self):
+        # Fixed timestep: logic always advances in 1/FPS steps, rendering takes what's left
+        lag = 0
+        while self.playing:
+            with self.profiler.section('tick'):
+                lag = min(lag + self.clock.tick(FPS), MAX_CATCHUP_STEPS * STEP_MS)
+            self.pump()
+            while lag >= STEP_MS and self.playing:
+                self.step()
+                lag -= STEP_MS
+            with self.profiler.section('draw'):
+                self.draw()
+            self.profiler.end_frame()
+        # run() calls main() again for the next game, so replays don't grow the stack
+        if self.gameOver():
+            self.restart()
+
+    def simulate(self, max_frames):
+        """Run logic steps as fast as the CPU allows, without drawing or frame limiting."""
+        while self.playing and self.frame < max_frames:
+            self.step()
+            self.profiler.end_frame()
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Play the game.")
+    parser.add_argument('level', nargs='?', help="level file to play instead of config.tile_map")
+    parser.add_argument('--seed', type=int, help="seed the game's randomness, e.g. to record a replayable session")
+    parser.add_argument('--record', help="write every logic step's input to this file")
+    parser.add_argument('--replay', help="play back a recorded input file instead of the keyboard")
+    args = parser.parse_args()
+
+    # A recording replays exactly (here or with simulation.py) given the same seed and level
+    controls = ScriptedControls.load(args.replay) if args.replay else KeyboardControls()
+    if args.record:
+        controls = RecordingControls(controls)
+    g = Game(seed=args.seed, controls=controls, level=load_level(args.level))
+    g.intro()
+    g.new()
+    while g.running:
+        g.main()
+
+    if args.record:
+        controls.save(args.record)
+    g.profiler.close()
+    pygame.quit()
+    sys.exit()
+
+
+# Run the game
+if __name__ == '__main__':
+    run()
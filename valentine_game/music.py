@@ -0,0 +1,104 @@
+# music.py
+
+import sys
+import threading
+import traceback
+import pygame
+from .config import AUDIO_CHANNELS, AUDIO_BUFFER
+from .resources import resources
+
+class Music:
+    def __init__(self, file_path, volume=0.5):
+        pygame.mixer.init()
+        self.file_path = file_path
+        self.volume = volume
+        pygame.mixer.music.load(self.file_path)
+        pygame.mixer.music.set_volume(self.volume)
+
+    def play(self, loops=-1):
+        """Play the music. Loops = -1 means it loops indefinitely."""
+        pygame.mixer.music.play(loops=loops)
+
+    def stop(self):
+        """Stop the music."""
+        pygame.mixer.music.stop()
+
+
+class AudioManager:
+    """Music plus short sound effects, set up off the main thread.
+
+    start() opens the mixer, decodes every effect into a Sound and starts the
+    music on an asset loader thread. play() never waits: until everything is
+    ready, or for unknown names, it does nothing. Effects share a fixed pool
+    of channels; when all are busy, the lowest-priority (then oldest) voice is
+    cut off, unless everything playing matters more than the new sound.
+    """
+
+    def __init__(self, channels=AUDIO_CHANNELS):
+        self.channel_count = channels
+        self.channels = []
+        self.priorities = []
+        self.started = []
+        self.plays = 0
+        self.sounds = {}
+        self.music = None
+        self.ready = threading.Event()
+
+    def start(self, music=None, effects=None):
+        """Load the music file and {name: path} effects in the background."""
+        future = resources.submit(self.load, music, effects or {})
+        future.add_done_callback(self.report)
+        return future
+
+    @staticmethod
+    def report(future):
+        """Print why loading failed; the game carries on without sound."""
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            print("Audio failed to load:", file=sys.stderr)
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    def load(self, music, effects):
+        pygame.mixer.init(buffer=AUDIO_BUFFER)  # A small buffer keeps effects in step with the game
+        pygame.mixer.set_num_channels(self.channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        self.priorities = [0] * self.channel_count
+        self.started = [0] * self.channel_count
+        for name, path in effects.items():
+            self.sounds[name] = pygame.mixer.Sound(path)
+        if music:
+            self.music = Music(music)
+            self.music.play()
+        self.ready.set()
+
+    def play(self, name, priority=0, volume=1.0):
+        """Start an effect on a free or stolen channel; returns the channel, or None if dropped."""
+        if not self.ready.is_set():
+            return None
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+
+        index = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = i
+                break
+        if index is None:
+            index = min(range(self.channel_count), key=lambda i: (self.priorities[i], self.started[i]))
+            if self.priorities[index] > priority:
+                return None  # Everything playing is more important
+
+        self.plays += 1
+        self.priorities[index] = priority
+        self.started[index] = self.plays
+        channel = self.channels[index]
+        channel.set_volume(volume)
+        channel.play(sound)
+        return channel
+
+    def stop(self):
+        if self.ready.is_set():
+            pygame.mixer.stop()
+            if self.music:
+                self.music.stop()
@@ -0,0 +1,136 @@
+# profiler.py
+
+import json
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+
+NULL_SECTION = nullcontext()
+
+
+class Section:
+    """Times a `with` block into the profiler's current frame."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+def percentiles(values):
+    """p50/p95/p99 of a sequence of numbers (nearest rank)."""
+    if not values:
+        return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {name: ordered[round(last * q)] for name, q in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99))}
+
+
+class Profiler:
+    """Per-frame timings of named sections with rolling percentiles.
+
+    Sections may nest (Player.update includes its collision calls), so their
+    times are not meant to add up to the frame time. When disabled, section()
+    returns a shared no-op context and wrap() leaves methods untouched.
+    """
+
+    def __init__(self, enabled=False, window=600, trace_path=None):
+        self.enabled = enabled
+        self.overlay = False
+        self.window = window
+        self.frame = 0
+        self.frame_times = deque(maxlen=window)
+        self.history = {}
+        self.current = defaultdict(float)
+        self.sections = {}
+        self.last_end = None
+        self.trace = open(trace_path, 'w') if enabled and trace_path else None
+        self.overlay_lines = []
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = Section(self, name)
+        return section
+
+    def add(self, name, seconds):
+        self.current[name] += seconds
+
+    def wrap(self, obj, attr, name):
+        """Time every call of obj.attr under `name` (e.g. a grid's collide method)."""
+        if not self.enabled:
+            return
+        method = getattr(obj, attr)
+        add = self.add
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                add(name, perf_counter() - start)
+
+        setattr(obj, attr, timed)
+
+    def end_frame(self):
+        """Close the current frame: record its wall time and section times."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_end is not None:
+            frame_ms = (now - self.last_end) * 1000
+            self.frame_times.append(frame_ms)
+            sections = {name: seconds * 1000 for name, seconds in self.current.items()}
+            for name, ms in sections.items():
+                history = self.history.get(name)
+                if history is None:
+                    history = self.history[name] = deque(maxlen=self.window)
+                history.append(ms)
+            if self.trace:
+                self.trace.write(json.dumps({'frame': self.frame, 'ms': round(frame_ms, 4),
+                                             'sections': {name: round(ms, 4) for name, ms in sections.items()}}) + '\n')
+        self.last_end = now
+        self.frame += 1
+        self.current.clear()
+
+    def summary(self):
+        return {
+            'frames': self.frame,
+            'frame_ms': percentiles(self.frame_times),
+            'sections': {name: percentiles(history) for name, history in self.history.items()},
+        }
+
+    def draw_overlay(self, surface, font):
+        """Draw frame-time percentiles and the slowest sections; returns the area covered."""
+        # Sorting the window every frame is wasteful, so the text refreshes twice a second
+        if self.frame % 30 == 0 or not self.overlay_lines:
+            summary = self.summary()
+            frame = summary['frame_ms']
+            lines = [f"frame p50 {frame['p50']:.2f}  p95 {frame['p95']:.2f}  p99 {frame['p99']:.2f} ms"]
+            slowest = sorted(summary['sections'].items(), key=lambda item: -item[1]['p95'])[:6]
+            lines += [f"{name}: p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}" for name, stats in slowest]
+            self.overlay_lines = [font.render(line, True, (255, 255, 255)) for line in lines]
+
+        height = sum(line.get_height() for line in self.overlay_lines) + 8
+        width = max(line.get_width() for line in self.overlay_lines) + 8
+        area = surface.fill((0, 0, 0), (0, 0, width, height))
+        y = 4
+        for line in self.overlay_lines:
+            surface.blit(line, (4, y))
+            y += line.get_height()
+        return area
+
+    def close(self):
+        if self.trace:
+            self.trace.close()
+            self.trace = None
@@ -0,0 +1,134 @@
+# resources.py
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from .config import ASSET_LOADER_THREADS
+from .bundle import Bundle, FILENAME as BUNDLE_FILENAME
+
+
+def get_asset_path(filename):
+    """Returns the correct path for any asset in the 'assets' folder."""
+    if hasattr(sys, '_MEIPASS'):  # Running as a PyInstaller bundle
+        base_path = sys._MEIPASS
+    else:  # Source checkout, pip install or py2app: assets ship inside the package
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, 'assets', filename)
+
+
+class ResourceManager:
+    """Loads, converts and scales each asset once and hands out shared surfaces.
+
+    Surfaces returned here are shared by every caller, so treat them as read-only
+    (blit from them, don't draw onto them). Files can also be read on background
+    threads with load_async(); image() then waits for them at first use. When
+    assets/bundle.bin has been built (see bundle.py), images and their scaled
+    copies come from its pre-decoded pixels instead of the PNG files.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.fonts = {}
+        self.texts = {}
+        self.disk_loads = 0
+        self.pending = {}
+        self.tasks = []
+        self.executor = None
+        self.bundle = None
+        self.bundle_checked = False
+        self.bundle_loads = 0
+
+    def submit(self, task, *args):
+        """Run task(*args) on a background loader thread, tracked by progress()."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(ASSET_LOADER_THREADS, thread_name_prefix='assets')
+        future = self.executor.submit(task, *args)
+        self.tasks.append(future)
+        return future
+
+    def get_bundle(self):
+        if not self.bundle_checked:
+            self.bundle = Bundle.open(get_asset_path(BUNDLE_FILENAME))
+            self.bundle_checked = True
+        return self.bundle
+
+    def bundled(self, path, scale=None):
+        """Pre-decoded pixels for an image from the bundle, or None."""
+        bundle = self.get_bundle()
+        surface = bundle.surface(path, scale) if bundle else None
+        if surface is not None:
+            self.bundle_loads += 1
+        return surface
+
+    def load_async(self, path):
+        """Start reading an image file in the background (not needed for bundled images)."""
+        if path not in self.pending and (path, None, None, True) not in self.images:
+            bundle = self.get_bundle()
+            if bundle and bundle.surface(path) is not None:
+                return
+            self.pending[path] = self.submit(pygame.image.load, path)
+
+    def progress(self):
+        """Fraction of background loads that have finished (1.0 when idle)."""
+        if not self.tasks:
+            return 1.0
+        return sum(task.done() for task in self.tasks) / len(self.tasks)
+
+    def image(self, path, scale=None, colorkey=None, alpha=True):
+        """Return a converted (and optionally scaled/colour-keyed) image."""
+        key = (path, scale, colorkey, alpha)
+        surface = self.images.get(key)
+        if surface is not None:
+            return surface
+
+        if scale is None and colorkey is None:
+            pending = self.pending.pop(path, None)
+            surface = self.bundled(path)
+            if surface is None:
+                self.disk_loads += 1
+                # Decoding may happen on a loader thread, but converting needs the display
+                surface = pending.result() if pending else pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        else:
+            bundled = self.bundled(path, scale) if scale is not None else None
+            if bundled is not None:
+                surface = bundled.convert_alpha() if alpha else bundled.convert()
+            elif scale is not None:
+                surface = pygame.transform.scale(self.image(path, alpha=alpha), scale)
+            else:
+                surface = self.image(path, alpha=alpha).copy()
+            if colorkey is not None:
+                surface.set_colorkey(colorkey)
+
+        self.images[key] = surface
+        return surface
+
+    def font(self, path, size):
+        """Return a shared font for (path, size)."""
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.disk_loads += 1
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        return font
+
+    def text(self, text, colour, size, path=None):
+        """Return a shared antialiased rendering of text, by (font, text, colour)."""
+        path = path or get_asset_path("font.ttf")
+        key = (path, size, text, tuple(colour))
+        surface = self.texts.get(key)
+        if surface is None:
+            surface = self.font(path, size).render(text, True, colour)
+            self.texts[key] = surface
+        return surface
+
+    def clear(self):
+        """Forget every cached resource (e.g. after the display mode changes)."""
+        self.images.clear()
+        self.fonts.clear()
+        self.texts.clear()
+
+
+resources = ResourceManager()
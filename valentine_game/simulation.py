@@ -0,0 +1,86 @@
+# simulation.py
+"""Headless, deterministic game sessions for soak tests and AI playtesting.
+
+    python -m valentine_game.simulation --seed 7 --frames 36000
+    python -m valentine_game.simulation --seed 7 --record run.txt      # record random play
+    python -m valentine_game.simulation --seed 7 --replay run.txt      # reproduce it exactly
+    python -m valentine_game.simulation --seed 7 --checkpoint cp.json --checkpoint-at 600
+    python -m valentine_game.simulation --seed 7 --resume cp.json      # carry on from frame 600
+"""
+
+import os
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Keep stdout to the JSON results
+
+import argparse
+import json
+import time
+from .main import Game
+from .controls import RandomControls, RecordingControls, ScriptedControls
+from .tilemap import load_level
+from .profiler import Profiler
+from . import snapshot
+
+MAX_FRAMES = 60 * 60 * 10  # Ten minutes of game time at 60 logic steps per second
+
+
+def run_session(game, seed=None, controls=None, max_frames=MAX_FRAMES, resume=None, checkpoint=None):
+    """Play one seeded session on a headless Game and return a compact result.
+
+    resume is a snapshot to continue from; checkpoint is a (path, frame) at
+    which to save one.
+    """
+    game.random.seed(seed)
+    game.controls = controls or RandomControls(seed)
+    game.new()
+    if resume:
+        snapshot.restore(game, resume)
+    if checkpoint:
+        path, frame = checkpoint
+        game.simulate(min(frame, max_frames))
+        snapshot.save(snapshot.capture(game), path)
+    game.simulate(max_frames)
+    return {
+        'seed': seed,
+        'won': game.all_enemies_dead,
+        'frames': game.frame,
+        'enemies_killed': game.enemies_killed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a headless game session.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--frames', type=int, default=MAX_FRAMES)
+    parser.add_argument('--level', help="binary .tmap level, or a text level laid out like config.tile_map")
+    parser.add_argument('--replay', help="replay a recorded input file instead of random play")
+    parser.add_argument('--record', help="write the inputs used to this file")
+    parser.add_argument('--checkpoint', help="save a snapshot of the game to this file")
+    parser.add_argument('--checkpoint-at', type=int, help="frame to save the checkpoint at (default: the end)")
+    parser.add_argument('--resume', help="continue from a saved checkpoint")
+    parser.add_argument('--profile', metavar='TRACE', help="time every step and write a JSON-lines trace here")
+    args = parser.parse_args()
+
+    controls = ScriptedControls.load(args.replay) if args.replay else RandomControls(args.seed)
+    if args.record:
+        controls = RecordingControls(controls)
+
+    game = Game(headless=True, level=load_level(args.level))
+    if args.profile:
+        game.profiler = Profiler(True, trace_path=args.profile)
+    start = time.perf_counter()
+    resume = snapshot.load(args.resume) if args.resume else None
+    checkpoint = (args.checkpoint, args.checkpoint_at or args.frames) if args.checkpoint else None
+    result = run_session(game, args.seed, controls, args.frames, resume, checkpoint)
+    elapsed = time.perf_counter() - start
+    result['speedup'] = round(result['frames'] / 60 / elapsed, 1) if elapsed else None
+
+    if args.record:
+        controls.save(args.record)
+    if args.profile:
+        game.profiler.close()
+        result['profile'] = game.profiler.summary()
+    print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+# snapshot.py
+"""Compact, JSON-serialisable snapshots of a running game.
+
+A snapshot holds only what changes during play: the player, every live enemy
+and attack (positions, facings, loop counters), the score, the game's RNG and,
+when the controls support it, their state. Walls never change, so restoring
+reuses the existing blocks and tile layer and only touches actors: enemies are
+revived or despawned in place and attacks come from the attack pool.
+
+    state = capture(game)
+    save(state, 'checkpoint.json')
+    restore(game, load('checkpoint.json'))   # game must be playing the same level
+"""
+
+import json
+
+
+def capture(game):
+    """Return the state of the game in progress as plain dicts, lists and numbers."""
+    if game.swarm:
+        game.swarm.sync()  # The swarm keeps facings and patrol counters in its arrays
+    player = game.player
+    controls = getattr(game.controls, 'state', None)
+    return {
+        'map': map_size(game),
+        'frame': game.frame,
+        'playing': game.playing,
+        'enemies_killed': game.enemies_killed,
+        'killed': sorted(game.chunks.killed) if game.chunks else [],
+        'random': game.random.getstate(),
+        'controls': controls() if controls else None,
+        'player': {
+            'alive': player.alive(),
+            'pos': (player.pos.x, player.pos.y),
+            'rect': player.rect.topleft,
+            'facing': player.facing,
+            'animation_loop': player.animation_loop,
+        },
+        'enemies': [{
+            'spawn': enemy.spawn,
+            'rect': enemy.rect.topleft,
+            'facing': enemy.facing,
+            'animation_loop': enemy.animation_loop,
+            'movement_loop': enemy.movement_loop,
+            'max_travel': enemy.max_travel,
+            'target': enemy.target,
+        } for enemy in game.enemies],
+        'attacks': [{
+            'rect': attack.rect.topleft,
+            'direction': attack.direction,
+            'animation_loop': attack.animation_loop,
+        } for attack in game.attacks],
+    }
+
+
+def restore(game, state, random=True, controls=True):
+    """Put a game (already started on the same level with new()) back into a captured state.
+
+    Pass random=False to keep the game's RNG where it is and roll fresh enemy
+    facings and patrol lengths from it, as new() would, and controls=False to
+    leave the input source where it is; a restart uses both so it neither
+    replays the same enemy patrols nor rewinds a recording to its first game.
+    """
+    if tuple(state['map']) != map_size(game):
+        raise ValueError(f"snapshot is of a {state['map'][0]}x{state['map'][1]} map, not this level")
+
+    player = game.player
+    data = state['player']
+    player.pos.update(data['pos'])
+    player.rect.topleft = data['rect']
+    player.facing = data['facing']
+    player.animation_loop = data['animation_loop']
+    if data['alive'] and not player.alive():
+        game.all_sprites.add(player)
+    player.animate()
+    player.dirty = 1
+
+    if game.swarm:
+        # Every enemy gets its state from the snapshot below. Marking the swarm stale
+        # first stops sync() (run by swarm.add() on revives) from copying the
+        # swarm's old facings and patrol counters back over restored enemies
+        game.swarm.stale = True
+
+    if game.chunks:
+        # Reload the chunks around the restored player, honouring the restored kills
+        chunks = game.chunks
+        for key in list(chunks.loaded):
+            chunks.unload(key)
+        chunks.killed = {tuple(spawn) for spawn in state['killed']}
+        chunks.center = None
+        chunks.update()
+        game.tile_layer = None
+
+    # Enemies only ever come back from the roster; ones in unloaded chunks keep their spawn state
+    wanted = {tuple(data['spawn']): data for data in state['enemies']}
+    for spawn, enemy in list(game.enemy_roster.items()):
+        data = wanted.get(spawn)
+        if data is None:
+            if enemy.alive():
+                enemy.despawn()
+            continue
+        enemy.rect.topleft = data['rect']
+        if random:
+            enemy.facing = data['facing']
+            enemy.max_travel = data['max_travel']
+        else:  # Same rolls, in the same order, as Enemy.__init__
+            enemy.facing = game.random.choice(['left', 'right'])
+            enemy.max_travel = game.random.randint(*game.enemy_max_travel)
+        enemy.animation_loop = data['animation_loop']
+        enemy.movement_loop = data['movement_loop']
+        enemy.target = tuple(data['target']) if data['target'] else None
+        if enemy.alive():
+            game.enemy_grid.move(enemy)
+        else:
+            enemy.revive()
+        enemy.animate()
+    if game.swarm:
+        game.swarm.sprites = game.enemies.sprites()
+
+    for attack in game.attacks.sprites():
+        attack.kill()  # Back to the pool
+    for data in state['attacks']:
+        attack = game.attack_pool.acquire(*data['rect'], data['direction'])
+        attack.animation_loop = data['animation_loop']
+
+    game.frame = state['frame']
+    game.playing = state['playing']
+    game.enemies_killed = state['enemies_killed']
+    game.all_enemies_dead = False
+    if random:
+        version, internal, gauss = state['random']
+        game.random.setstate((version, tuple(internal), gauss))
+    restore_controls = getattr(game.controls, 'restore', None)
+    if controls and restore_controls and state['controls'] is not None:
+        restore_controls(state['controls'])
+    game.input.drain()
+    game.input_shown_at = None
+    if game.flow_field:
+        game.flow_field.origin = None  # Recomputed from the restored player tile
+    game.full_redraw = True
+
+
+def map_size(game):
+    if game.chunks:
+        return game.tile_map.width, game.tile_map.height
+    return max(len(row) for row in game.tile_map), len(game.tile_map)
+
+
+def save(state, path):
+    with open(path, 'w') as f:
+        json.dump(state, f, separators=(',', ':'))
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
@@ -0,0 +1,74 @@
+# spatial.py
+
+from .config import TILE_SIZE
+
+
+class SpatialHash:
+    """Uniform grid index of sprites keyed by TILE_SIZE cells.
+
+    Collision queries only look at sprites in the cells a rect overlaps, so their
+    cost depends on how crowded the neighbourhood is, not on the map size.
+    Cells are plain dicts so iteration order (and therefore collision resolution)
+    is deterministic.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.sprite_cells = {}
+
+    def __len__(self):
+        return len(self.sprite_cells)
+
+    def __contains__(self, sprite):
+        return sprite in self.sprite_cells
+
+    def cells_for(self, rect):
+        """Return the keys of every cell a rect overlaps."""
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        return tuple((cx, cy) for cy in range(top, bottom + 1) for cx in range(left, right + 1))
+
+    def insert(self, sprite):
+        keys = self.cells_for(sprite.rect)
+        self.sprite_cells[sprite] = keys
+        for key in keys:
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = {}
+            cell[sprite] = None
+
+    def remove(self, sprite):
+        keys = self.sprite_cells.pop(sprite, ())
+        for key in keys:
+            cell = self.cells[key]
+            del cell[sprite]
+            if not cell:
+                del self.cells[key]
+
+    def move(self, sprite):
+        """Re-index a sprite after its rect changed; cheap when it stayed in its cells."""
+        keys = self.cells_for(sprite.rect)
+        if self.sprite_cells.get(sprite) != keys:
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def query(self, rect):
+        """Return the sprites in every cell the rect overlaps (a superset of the hits)."""
+        found = {}
+        cells = self.cells
+        for key in self.cells_for(rect):
+            cell = cells.get(key)
+            if cell:
+                found.update(cell)
+        return list(found)
+
+    def collide(self, sprite):
+        """Return indexed sprites whose rect collides with the given sprite's rect."""
+        rect = sprite.rect
+        return [other for other in self.query(rect) if rect.colliderect(other.rect)]
+
+    def clear(self):
+        self.cells.clear()
+        self.sprite_cells.clear()
@@ -0,0 +1,444 @@
+# sprites.py
+import pygame
+from .config import TILE_SIZE, PLAYER_LAYER, BLOCK_LAYER, PLAYER_SPEED, ENEMY_LAYER, BLACK, ATTACK_POOL_SIZE
+from .atlas import atlas
+from .resources import get_asset_path, resources
+
+# Animation specs: name -> [(x, y, width, height, flip_x, flip_y), ...]
+PLAYER_ANIMATIONS = {
+    'setUp': [(-7, 5, 20, 32, False, False)],
+    'down': [(70, 80, 32, 32, False, False), (102, 80, 32, 32, False, False)],
+    'up': [(70, 80, 32, 32, False, True)] * 2,
+    'left': [(0, 40, 20, 32, True, False)] * 2,
+    'right': [(0, 40, 20, 32, False, False), (32, 40, 32, 32, False, False)]
+}
+
+ENEMY_ANIMATIONS = {
+    'left': [(0, 53, 20, 20, False, False), (20, 53, 20, 20, False, False)],
+    'right': [(95, 53, 20, 20, False, False), (40, 53, 20, 20, False, False)]
+}
+
+ATTACK_ANIMATIONS = {
+    'up': [(i * 32, 0, TILE_SIZE, TILE_SIZE, False, False) for i in range(5)],
+    'down': [(i * 32, 32, TILE_SIZE, TILE_SIZE, False, False) for i in range(5)],
+    'left': [(i * 32, 96, TILE_SIZE, TILE_SIZE, False, False) for i in range(5)],
+    'right': [(i * 32, 64, TILE_SIZE, TILE_SIZE, False, False) for i in range(5)]
+}
+
+TILE_SCALE = (TILE_SIZE, TILE_SIZE)
+
+class Spritesheet:
+    def __init__(self, filename):
+        self.filename = filename
+        self.spritesheet = resources.image(filename)
+
+    def get_sprite(self, x, y, width, height):
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)  # Preserve transparency
+        sprite.blit(self.spritesheet, (0, 0), (x, y, width, height))
+        sprite.set_colorkey(BLACK)# Set black as transparent
+        return sprite
+
+
+def preload_animations(game):
+    """Slice, scale and flip every animation frame into the shared atlas up front."""
+    atlas.animations(game.character, PLAYER_ANIMATIONS)
+    atlas.animations(game.character, PLAYER_ANIMATIONS, TILE_SCALE)
+    atlas.animations(game.enemy, ENEMY_ANIMATIONS)
+    atlas.frame(game.enemy, (0, 53, 20, 20), TILE_SCALE)
+    atlas.animations(game.attack_spritesheet, ATTACK_ANIMATIONS)
+
+
+class Player(pygame.sprite.DirtySprite):
+    def __init__(self, game, x, y):
+        self.game = game
+        self._layer = PLAYER_LAYER
+        self.groups = self.game.all_sprites
+        pygame.sprite.DirtySprite.__init__(self, self.groups)
+
+        self.x = x * TILE_SIZE
+        self.y = y * TILE_SIZE
+        self.width = TILE_SIZE
+        self.height = TILE_SIZE
+
+        self.facing = 'setUp'
+        self.animation_loop = 0
+
+        # Initial static image
+        self.image = atlas.frame(self.game.character, (-7, 5, 20, 32), TILE_SCALE)
+        self.rect = self.image.get_rect()
+        self.rect.topleft = (self.x, self.y)
+
+        self.pos = pygame.Vector2(self.rect.topleft)
+        self.speed = PLAYER_SPEED
+
+        # Shared frames: raw ones for idle, pre-scaled ones while moving
+        self.animations = atlas.animations(self.game.character, PLAYER_ANIMATIONS)
+        self.scaled_animations = atlas.animations(self.game.character, PLAYER_ANIMATIONS, TILE_SCALE)
+
+    def update(self):
+        old_topleft, old_image = self.rect.topleft, self.image
+        self.movement()
+        self.animate()
+
+        # Convert to integer to prevent floating-point errors
+        self.rect.topleft = (int(self.pos.x), int(self.pos.y))
+        self.collide_blocks('x')
+        self.collide_blocks('y')
+        self.collide_enemy()
+
+        # Only ask the dirty-rect renderer to repaint us when something changed
+        if self.rect.topleft != old_topleft or self.image is not old_image:
+            self.dirty = 1
+
+
+    def movement(self):
+        direction = self.game.action.direction
+        if direction == 'left':
+            self.pos.x -= self.speed
+            self.facing = 'left'
+        elif direction == 'right':
+            self.pos.x += self.speed
+            self.facing = 'right'
+        elif direction == 'up':
+            self.pos.y -= self.speed
+            self.facing = 'up'
+        elif direction == 'down':
+            self.pos.y += self.speed
+            self.facing = 'down'
+
+    def collide_enemy(self):
+        hits = self.game.enemy_grid.collide(self)
+        if hits:
+            self.kill()  # Kill the player sprite
+            self.game.playing = False  # Stop the game loop, transition to gameOver
+
+
+    def collide_blocks(self, direction):
+        """Handle collision with blocks more accurately."""
+        if direction == 'x':
+            hits = self.game.block_grid.collide(self)
+            for hit in hits:
+                if self.rect.centerx < hit.rect.centerx:
+                    self.pos.x = hit.rect.left - self.rect.width
+                elif self.rect.centerx > hit.rect.centerx:
+                    self.pos.x = hit.rect.right
+                self.rect.x = self.pos.x  # Sync position
+
+        elif direction == 'y':
+            hits = self.game.block_grid.collide(self)
+            for hit in hits:
+                if self.rect.centery < hit.rect.centery:
+                    self.pos.y = hit.rect.top - self.rect.height
+                elif self.rect.centery > hit.rect.centery:
+                    self.pos.y = hit.rect.bottom
+                self.rect.y = self.pos.y  # Sync position
+
+
+    def animate(self):
+        animation = self.animations[self.facing]
+
+        if self.rect.topleft != (int(self.pos.x), int(self.pos.y)):  # Check if player is moving
+            self.image = self.scaled_animations[self.facing][int(self.animation_loop)]
+            self.animation_loop += 0.1
+            if self.animation_loop >= len(animation):
+                self.animation_loop = 0
+        else:
+            self.image = animation[0]  # Use first frame of the current direction when idle
+
+class Enemy(pygame.sprite.DirtySprite):
+    def __init__(self, game, x, y):
+        self.game = game
+        self._layer = ENEMY_LAYER
+        self.groups = self.game.all_sprites, self.game.enemies
+        pygame.sprite.DirtySprite.__init__(self, self.groups)
+
+        self.x = x * TILE_SIZE
+        self.y = y * TILE_SIZE
+        self.spawn = (x, y)  # Tile the enemy was placed on, so streamed maps remember kills
+        self.width = TILE_SIZE
+        self.height = TILE_SIZE
+
+        self.x_change = 0
+        self.y_change = 0
+        self.facing = self.game.random.choice(['left', 'right'])
+        self.animation_loop = 0
+        self.movement_loop = 0
+        self.max_travel = self.game.random.randint(*self.game.enemy_max_travel)
+        self.target = None  # Next tile's top-left while chasing the player
+        self.dirty = 2  # Patrols every frame, so always repaint
+
+        self.image = atlas.frame(self.game.enemy, (0, 53, 20, 20), TILE_SCALE)
+        self.rect = self.image.get_rect()
+        self.rect.topleft = (self.x, self.y)
+        self.game.enemy_grid.insert(self)
+        self.game.enemy_roster[self.spawn] = self
+
+        self.animations = atlas.animations(self.game.enemy, ENEMY_ANIMATIONS)
+        if self.game.swarm:
+            self.game.swarm.add(self)
+
+    def update(self):
+        if self.game.swarm:
+            return  # Moved in bulk by EnemySwarm.update
+        if not (self.game.flow_field and self.chase()):
+            self.movement()
+        self.animate()
+        self.rect.x += self.x_change
+        self.rect.y += self.y_change
+        self.x_change = self.y_change = 0  # Reset movement after applying changes
+        self.game.enemy_grid.move(self)
+
+    def kill(self):
+        self.despawn()
+        self.game.enemy_killed(self)
+
+    def despawn(self):
+        """Remove the enemy from the game without counting it as killed."""
+        self.game.enemy_grid.remove(self)
+        if self.game.swarm:
+            self.game.swarm.remove(self)
+        pygame.sprite.DirtySprite.kill(self)
+
+    def revive(self):
+        """Put a despawned or killed enemy back into play at its current rect."""
+        self.add(*self.groups)
+        self.game.enemy_grid.insert(self)
+        if self.game.swarm:
+            self.game.swarm.add(self)
+
+    def chase(self):
+        """Head one tile at a time towards the player along the game's flow field.
+
+        Returns False (and the enemy patrols instead) when the player is out of reach.
+        """
+        if self.target is None or self.rect.topleft == self.target:
+            tile_x, tile_y = self.rect.x // TILE_SIZE, self.rect.y // TILE_SIZE
+            step = self.game.flow_field.step(tile_x, tile_y)
+            if step is None:
+                self.target = None
+                return False  # Leave the patrol where it was, off the grid or not
+            corner = (tile_x * TILE_SIZE, tile_y * TILE_SIZE)
+            if self.target is None and self.rect.topleft != corner:
+                self.target = corner  # Line up on the tile grid first
+            else:
+                self.target = ((tile_x + step[0]) * TILE_SIZE, (tile_y + step[1]) * TILE_SIZE)
+
+        speed = self.game.enemy_speed
+        self.x_change = max(-speed, min(speed, self.target[0] - self.rect.x))
+        self.y_change = max(-speed, min(speed, self.target[1] - self.rect.y))
+        if self.x_change:
+            self.facing = 'left' if self.x_change < 0 else 'right'
+        return True
+
+    def movement(self):
+        """Update enemy movement in a more stable loop."""
+        if self.facing == 'left':
+            self.x_change = -self.game.enemy_speed
+            self.movement_loop -= 1
+            if self.movement_loop <= -self.max_travel:
+                self.facing = 'right'
+
+        elif self.facing == 'right':
+            self.x_change = self.game.enemy_speed
+            self.movement_loop += 1
+            if self.movement_loop >= self.max_travel:
+                self.facing = 'left'
+
+
+        elif self.facing == 'right':
+            self.x_change = self.game.enemy_speed
+            self.movement_loop += 1
+            if self.movement_loop >= self.max_travel:
+                self.facing = 'left'
+
+    def animate(self):
+        animation = self.animations[self.facing]
+        self.image = animation[int(self.animation_loop)]
+
+class Block(pygame.sprite.Sprite):
+    def __init__(self, game, x, y):
+        self.game = game
+        self._layer = BLOCK_LAYER
+        # Blocks are static: they are baked into Game.tile_layer instead of all_sprites
+        self.groups = self.game.blocks
+        pygame.sprite.Sprite.__init__(self, self.groups)
+
+        # Shared texture: loaded and scaled once for every block on the map
+        self.image = resources.image(get_asset_path("block.png"), TILE_SCALE, BLACK)
+        self.rect = self.image.get_rect()
+        self.rect.topleft = (x * TILE_SIZE, y * TILE_SIZE)
+ 
+def shade(colour, amount):
+    """Mix a colour towards white (amount > 0) or black (amount < 0)."""
+    target = 255 if amount > 0 else 0
+    return tuple(int(c + (target - c) * abs(amount)) for c in colour[:3])
+
+
+class Button:
+    """Heart-shaped button composed once per state (normal, hover, pressed).
+
+    draw() is a single blit; update() switches state as the mouse moves and
+    returns True when the button needs to be drawn again.
+    """
+
+    def __init__(self, x, y, width, height, fg, bg, content, fontsize):
+        self.fontsize = fontsize
+        self.content = content
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.fg = fg
+        self.bg = bg
+
+        self.state = 'normal'
+        self.images = {}
+        self.image = self.render(self.state)
+        self.rect = self.image.get_rect(topleft=(self.x, self.y))
+
+    def render(self, state):
+        """Compose (once) the heart-shaped button with its label centered, for a state."""
+        image = self.images.get(state)
+        if image is not None:
+            return image
+
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)  # Use SRCALPHA for transparency
+        colour = {'normal': self.bg, 'hover': shade(self.bg, 0.2), 'pressed': shade(self.bg, -0.25)}[state]
+        pygame.draw.polygon(image, colour, [
+            (self.width // 2, self.height),       # Bottom point
+            (0, self.height // 3),                # Left curve
+            (self.width // 4, 0),                 # Top-left
+            (self.width // 2, self.height // 4),  # Middle-top
+            (3 * self.width // 4, 0),             # Top-right
+            (self.width, self.height // 3)        # Right curve
+        ])
+
+        text = resources.text(self.content, self.fg, self.fontsize)
+        text_rect = text.get_rect(center=(self.width // 2, self.height // 2 + (2 if state == 'pressed' else 0)))
+        image.blit(text, text_rect)
+        self.images[state] = image
+        return image
+
+    def update(self, mouse_pos, mouse_pressed):
+        """Follow the mouse; returns True if the button's look changed."""
+        if self.is_pressed(mouse_pos, mouse_pressed):
+            state = 'pressed'
+        elif self.is_pressed(mouse_pos, (1, 0, 0)):
+            state = 'hover'
+        else:
+            state = 'normal'
+        if state == self.state:
+            return False
+        self.state = state
+        self.image = self.render(state)
+        return True
+
+    def draw(self, screen):
+        """Blit the pre-rendered button and return the area it covers."""
+        return screen.blit(self.image, self.rect)
+
+    def is_pressed(self, mouse_pos, mouse_pressed):
+        """Check if the mouse is inside the heart's approximate bounding box."""
+        if self.x < mouse_pos[0] < self.x + self.width and self.y < mouse_pos[1] < self.y + self.height:
+            if mouse_pressed[0]:  # Left mouse button pressed
+                return True
+        return False
+
+class AttackPool:
+    """Hands out finished Attack sprites again instead of allocating new ones.
+
+    At most `size` idle attacks are kept; created/reused counts show how well
+    the pool is sized for the fire rate.
+    """
+
+    def __init__(self, game, size=ATTACK_POOL_SIZE):
+        self.game = game
+        self.size = size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, x, y, direction):
+        if self.free:
+            attack = self.free.pop()
+            attack.spawn(x, y, direction)
+            self.reused += 1
+            return attack
+        self.created += 1
+        return Attack(self.game, x, y, direction)
+
+    def release(self, attack):
+        if len(self.free) < self.size:
+            self.free.append(attack)
+
+    def stats(self):
+        return {
+            'size': self.size,
+            'created': self.created,
+            'reused': self.reused,
+            'free': len(self.free),
+            'in_use': len(self.game.attacks),
+        }
+
+
+class Attack(pygame.sprite.DirtySprite):
+    def __init__(self, game, x, y, direction):
+        self.game = game
+        self._layer = PLAYER_LAYER
+        pygame.sprite.DirtySprite.__init__(self)
+
+        self.width = TILE_SIZE
+        self.height = TILE_SIZE
+        self.dirty = 2  # Animates every frame, so always repaint
+
+        self.animations = self.load_animations()
+        self.image = self.animations[direction][0]
+        self.rect = self.image.get_rect()
+        self.spawn(x, y, direction)
+
+    def spawn(self, x, y, direction):
+        """(Re)start the attack at a position; pooled attacks come back through here."""
+        self.groups = self.game.all_sprites, self.game.attacks
+        self.add(*self.groups)
+
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.animation_loop = 0
+        self.image = self.animations[direction][0]
+        self.rect.x = self.x
+        self.rect.y = self.y
+
+    def kill(self):
+        if self.alive():
+            pygame.sprite.DirtySprite.kill(self)
+            self.game.attack_pool.release(self)
+
+    def load_animations(self):
+        """Return the shared animation frames for each direction."""
+        return atlas.animations(self.game.attack_spritesheet, ATTACK_ANIMATIONS)
+
+    def update(self):
+        """Update attack animation and check for collisions."""
+        self.animate()
+        self.collide_enemy()
+
+    def animate(self):
+        """Animate the attack and remove it once the animation completes."""
+        animation = self.animations[self.direction]
+        frame_index = min(int(self.animation_loop), len(animation) - 1)
+        self.image = animation[frame_index]
+
+        self.animation_loop += 0.2  # Adjust animation speed for smoother animation
+        if self.animation_loop >= len(animation):
+            self.kill()  # Remove the attack after animation ends
+
+
+
+    def collide_enemy(self):
+        """Check for collisions with enemies and handle them."""
+        hits = self.game.enemy_grid.collide(self)
+        for hit in hits:
+            hit.kill()  # Remove the enemy on collision
+            self.kill()  # Remove the attack after hitting an enemy
+
@@ -0,0 +1,92 @@
+# swarm.py
+
+import numpy as np
+
+LEFT, RIGHT = -1, 1
+FACINGS = {'left': LEFT, 'right': RIGHT}
+FACING_NAMES = {LEFT: 'left', RIGHT: 'right'}
+
+
+class EnemySwarm:
+    """Batched patrol logic for every Enemy, stored in NumPy arrays.
+
+    Enemy sprites stay in their groups for drawing and collisions, but their
+    update() becomes a no-op: one vectorised step per frame moves every enemy
+    exactly like Enemy.movement would, then writes positions back to the rects.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.sprites = []
+        self.stale = True
+        self.dead = 0
+
+    def add(self, enemy):
+        self.sync()
+        self.sprites.append(enemy)
+        self.stale = True
+
+    def remove(self, enemy):
+        if not self.stale:
+            self.alive[self.index[enemy]] = False
+        self.dead += 1
+
+    def rebuild(self):
+        """Reload the arrays from the sprites, dropping dead ones."""
+        self.sprites = [sprite for sprite in self.sprites if sprite.alive()]
+        self.index = {sprite: i for i, sprite in enumerate(self.sprites)}
+        self.x = np.array([sprite.rect.x for sprite in self.sprites], dtype=np.int64)
+        self.facing = np.array([FACINGS[sprite.facing] for sprite in self.sprites], dtype=np.int8)
+        self.loop = np.array([sprite.movement_loop for sprite in self.sprites], dtype=np.int64)
+        self.max_travel = np.array([sprite.max_travel for sprite in self.sprites], dtype=np.int64)
+        self.width = np.array([sprite.rect.width for sprite in self.sprites], dtype=np.int64)
+        self.alive = np.ones(len(self.sprites), dtype=bool)
+        # Facing each sprite's image was last set for (0 = not set yet)
+        self.drawn_facing = np.zeros(len(self.sprites), dtype=np.int8)
+        self.stale = False
+        self.dead = 0
+
+    def sync(self):
+        """Write facing and patrol counters back to the Enemy sprites."""
+        if self.stale:
+            return
+        for i, sprite in enumerate(self.sprites):
+            sprite.facing = FACING_NAMES[int(self.facing[i])]
+            sprite.movement_loop = int(self.loop[i])
+
+    def update(self):
+        if self.stale or self.dead > len(self.sprites) // 2:
+            self.sync()
+            self.rebuild()
+        if not self.sprites:
+            return
+
+        facing = self.facing
+        alive = self.alive
+        old_x = self.x
+
+        # Same rules as Enemy.movement: step, count, and turn at the end of the patrol
+        step = np.where(alive, facing, 0)
+        self.x = old_x + step * self.game.enemy_speed
+        self.loop += step
+        turn = alive & (((facing == LEFT) & (self.loop <= -self.max_travel)) |
+                        ((facing == RIGHT) & (self.loop >= self.max_travel)))
+        facing[turn] = -facing[turn]
+
+        sprites = self.sprites
+        xs = self.x.tolist()
+        for i in np.flatnonzero(alive).tolist():
+            sprites[i].rect.x = xs[i]
+
+        # Only touch images and grid cells that actually changed
+        for i in np.flatnonzero(alive & (facing != self.drawn_facing)).tolist():
+            sprite = sprites[i]
+            sprite.image = sprite.animations[FACING_NAMES[int(facing[i])]][int(sprite.animation_loop)]
+        self.drawn_facing[:] = facing
+
+        cell_size = self.game.enemy_grid.cell_size
+        old_right, new_right = old_x + self.width - 1, self.x + self.width - 1
+        moved_cell = alive & ((old_x // cell_size != self.x // cell_size) |
+                              (old_right // cell_size != new_right // cell_size))
+        for i in np.flatnonzero(moved_cell).tolist():
+            self.game.enemy_grid.move(sprites[i])
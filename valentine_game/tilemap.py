@@ -0,0 +1,126 @@
+# tilemap.py
+"""Compact binary tile maps.
+
+A .tmap file is a small header followed by one byte per tile, row by row, using
+the same characters as config.tile_map ('B', 'E', 'P', '.'). The tile bytes are
+memory-mapped, so opening a 10k x 10k level only touches the pages that are read.
+
+    python -m valentine_game.tilemap generate 10000 10000 big.tmap --seed 1
+    python -m valentine_game.tilemap convert level.txt level.tmap
+"""
+
+import argparse
+import struct
+import numpy as np
+
+MAGIC = b'TMP1'
+HEADER = struct.Struct('<4sIIIII')  # magic, width, height, player x, player y, enemy count
+
+WALL, ENEMY, PLAYER, FLOOR = (ord(c) for c in 'BEP.')
+
+
+class TileMap:
+    """A (height, width) array of tile bytes plus the player spawn and enemy count."""
+
+    def __init__(self, tiles, player, enemy_count):
+        self.tiles = tiles
+        self.height, self.width = tiles.shape
+        self.player = player
+        self.enemy_count = enemy_count
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a map from config.tile_map-style rows of characters."""
+        width = max(len(row) for row in rows)
+        tiles = np.full((len(rows), width), FLOOR, dtype=np.uint8)
+        for y, row in enumerate(rows):
+            tiles[y, :len(row)] = np.frombuffer(row.encode('ascii'), dtype=np.uint8)
+        players = np.argwhere(tiles == PLAYER)
+        player = (int(players[0][1]), int(players[0][0])) if len(players) else (1, 1)
+        return cls(tiles, player, int(np.count_nonzero(tiles == ENEMY)))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, width, height, player_x, player_y, enemy_count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a tile map file")
+        tiles = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER.size, shape=(height, width))
+        return cls(tiles, (player_x, player_y), enemy_count)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.width, self.height, self.player[0], self.player[1], self.enemy_count))
+            f.write(np.ascontiguousarray(self.tiles).tobytes())
+
+    def region(self, x, y, width, height):
+        """Return the tiles in a rectangle (clipped to the map), and its clipped origin."""
+        x0, y0 = max(0, x), max(0, y)
+        return self.tiles[y0:min(self.height, y + height), x0:min(self.width, x + width)], (x0, y0)
+
+
+def load_level(path):
+    """Read a binary .tmap level, or a text one laid out like config.tile_map."""
+    if path is None:
+        return None
+    if path.endswith('.tmap'):
+        return TileMap.load(path)
+    with open(path) as f:
+        return [line.rstrip('\n') for line in f if line.strip()]
+
+
+def generate(path, width, height, seed=None, wall_chance=0.12, enemy_chance=0.004, strip_rows=256):
+    """Write a random walled level straight to a .tmap file, a strip of rows at a time."""
+    rng = np.random.default_rng(seed)
+    player = (width // 2, height // 2)
+    enemy_count = 0
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, width, height, player[0], player[1], 0))
+        for top in range(0, height, strip_rows):
+            rows = min(strip_rows, height - top)
+            roll = rng.random((rows, width), dtype=np.float32)
+            strip = np.full((rows, width), FLOOR, dtype=np.uint8)
+            strip[roll < wall_chance] = WALL
+            strip[roll > 1 - enemy_chance] = ENEMY
+            strip[:, [0, -1]] = WALL
+            if top == 0:
+                strip[0] = WALL
+            if top + rows == height:
+                strip[-1] = WALL
+
+            # Keep a clear 5x5 area around the spawn so the player isn't boxed in or hit at once
+            py = player[1] - top
+            if -2 <= py < rows + 2:
+                strip[max(0, py - 2):max(0, py + 3), player[0] - 2:player[0] + 3] = FLOOR
+                if 0 <= py < rows:
+                    strip[py, player[0]] = PLAYER
+
+            enemy_count += int(np.count_nonzero(strip == ENEMY))
+            f.write(strip.tobytes())
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, width, height, player[0], player[1], enemy_count))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create binary tile maps.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    gen = commands.add_parser('generate', help="write a random level")
+    gen.add_argument('width', type=int)
+    gen.add_argument('height', type=int)
+    gen.add_argument('path')
+    gen.add_argument('--seed', type=int)
+    convert = commands.add_parser('convert', help="convert a text level (one row per line)")
+    convert.add_argument('source')
+    convert.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        generate(args.path, args.width, args.height, args.seed)
+    else:
+        TileMap.from_rows(load_level(args.source)).save(args.path)
+
+
+if __name__ == '__main__':
+    main()
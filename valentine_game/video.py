@@ -0,0 +1,151 @@
+# video.py
+
+import os
+import queue
+import tempfile
+import threading
+import numpy as np
+import pygame
+
+cv2 = None  # OpenCV is slow to import and only the game-over video needs it
+
+
+def opencv():
+    """Import OpenCV on first use (normally on the decoder thread)."""
+    global cv2
+    if cv2 is None:
+        import cv2 as module
+        cv2 = module
+    return cv2
+
+
+class VideoPlayer:
+    """Decodes a video off the main thread into ready-to-blit frames.
+
+    cache=None streams the clip through a bounded ring buffer, re-decoding it on
+    every loop. cache='memory' decodes it once and keeps the scaled frames, and
+    cache='mmap' also writes them to a raw file that later runs memory-map
+    instead of decoding. next_frame() never blocks: if the decoder is behind,
+    the previous frame is shown again.
+    """
+
+    def __init__(self, path, size, cache=None, buffer_frames=8):
+        self.path = path
+        self.size = size
+        self.cache = cache
+        self.buffer = queue.Queue(buffer_frames)
+        self.frames = []
+        self.complete = False
+        self.position = 0
+        self.last = None
+        self.thread = None
+        self.stopping = threading.Event()
+        self.rewind_requested = threading.Event()
+
+    @property
+    def cache_path(self):
+        """Raw RGB frame file for this clip, size and source modification time."""
+        mtime = int(os.path.getmtime(self.path)) if os.path.exists(self.path) else 0
+        name = f"{os.path.splitext(os.path.basename(self.path))[0]}-{self.size[0]}x{self.size[1]}-{mtime}.rgb"
+        return os.path.join(tempfile.gettempdir(), name)
+
+    def start(self):
+        """Start decoding in the background (does nothing if already started)."""
+        if self.thread is not None:
+            return
+        if self.cache == 'mmap' and os.path.exists(self.cache_path):
+            self.open_cache(self.cache_path)
+            return
+        self.thread = threading.Thread(target=self.produce, daemon=True)
+        self.thread.start()
+
+    def open_cache(self, path):
+        frame_bytes = self.size[0] * self.size[1] * 3
+        count = os.path.getsize(path) // frame_bytes
+        if count:
+            self.frames = np.memmap(path, dtype=np.uint8, mode='r', shape=(count, self.size[1], self.size[0], 3))
+        self.complete = True
+
+    def convert(self, frame):
+        """BGR frame straight from OpenCV -> contiguous RGB rows at the target size."""
+        cv2 = opencv()
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return cv2.resize(frame, self.size)
+
+    def produce(self):
+        cv2 = opencv()
+        capture = cv2.VideoCapture(self.path)
+        writer = None
+        if self.cache == 'mmap':
+            writer = open(self.cache_path + '.part', 'wb')
+
+        looped_without_frames = False
+        while capture.isOpened() and not self.stopping.is_set():
+            if self.rewind_requested.is_set():
+                self.rewind_requested.clear()
+                capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+            ok, frame = capture.read()
+            if not ok:
+                if self.cache or looped_without_frames:
+                    break  # Whole clip decoded (or it has no frames at all)
+                # Seek back here, on the producer thread, so the game loop never stalls
+                capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                looped_without_frames = True
+                continue
+            looped_without_frames = False
+
+            frame = self.convert(frame)
+            if self.cache:
+                self.frames.append(frame)
+                if writer:
+                    writer.write(frame.tobytes())
+                continue
+            while not self.stopping.is_set():
+                try:
+                    self.buffer.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    if self.rewind_requested.is_set():
+                        break
+
+        capture.release()
+        if writer:
+            writer.close()
+            if self.stopping.is_set() or not self.frames:
+                os.remove(writer.name)
+            else:
+                os.replace(writer.name, self.cache_path)
+                self.open_cache(self.cache_path)  # Swap the in-memory frames for the mapped file
+        self.complete = True
+
+    def rewind(self):
+        """Restart playback from the first frame."""
+        self.position = 0
+        if not self.cache:
+            self.rewind_requested.set()
+            while not self.buffer.empty():
+                self.buffer.get_nowait()
+
+    def next_frame(self):
+        """Return the next frame as a Surface, the previous one if none is ready, or None."""
+        if self.cache:
+            count = len(self.frames)
+            if self.position >= count:
+                if not (self.complete and count):
+                    return self.last
+                self.position = 0
+            array = self.frames[self.position]
+            self.position += 1
+        else:
+            try:
+                array = self.buffer.get_nowait()
+            except queue.Empty:
+                return self.last
+        self.last = pygame.image.frombuffer(array, self.size, 'RGB')
+        return self.last
+
+    def release(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()